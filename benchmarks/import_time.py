@@ -0,0 +1,57 @@
+"""Import-time benchmark for the headless multiverse package.
+
+Imports the package in fresh interpreters (python -X importtime), reports the
+best cumulative import time, and fails when it exceeds the budget or when the
+import pulls in the GUI toolkit or NumPy, so worker processes stay cheap.
+
+    python benchmarks/import_time.py [--runs 5] [--budget-ms 100]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+FORBIDDEN = ("tkinter", "ttkbootstrap", "numpy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_microseconds(module):
+    """Imports module in a fresh interpreter; returns (cumulative microseconds, forbidden modules loaded)."""
+    check = f"import sys, {module}; print(','.join(m for m in {FORBIDDEN!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", check], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            cumulative = int(fields[1])
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return cumulative, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="multiverse")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    args = parser.parse_args(argv)
+
+    timings = []
+    for _ in range(args.runs):
+        cumulative, loaded = import_microseconds(args.module)
+        if loaded:
+            print(f"FAIL: importing {args.module} loads {', '.join(loaded)}")
+            return 1
+        timings.append(cumulative)
+
+    best = min(timings) / 1000
+    print(f"import {args.module}: best {best:.1f} ms of {args.runs} runs (budget {args.budget_ms:.0f} ms)")
+    if best > args.budget_ms:
+        print("FAIL: import time over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,25 @@
+"""Headless core of the ℤn-verse: containers, graphs, universes and the multiverse.
+
+Importing the package has no side effects and loads neither the GUI toolkit nor
+NumPy; Multiverse_Model (the Tk GUI) is imported from multiverse.gui on first access."""
+
+from .core import My_Multiverse, My_Reachability_Index
+from .graph import My_Compact_Directed_Graph, My_CSR_Graph, My_Directed_Graph, My_Row_Pool, My_Row_View
+from .storage import My_Multiverse_File, My_Mutation_Log
+from .structures import My_Dict, My_List, My_List_Iterator, My_List_View, My_LRU_Cache, My_Set, My_Set_View
+from .universe import My_Moduli_Lattice, My_Zn_Difference, My_Zn_Union, My_Zn_verse
+
+__all__ = [
+    "My_List", "My_List_Iterator", "My_List_View", "My_Dict", "My_Set", "My_Set_View", "My_LRU_Cache",
+    "My_Directed_Graph", "My_Row_Pool", "My_Row_View", "My_Compact_Directed_Graph", "My_CSR_Graph",
+    "My_Zn_verse", "My_Zn_Union", "My_Zn_Difference",
+    "My_Moduli_Lattice", "My_Multiverse", "My_Reachability_Index",
+    "My_Multiverse_File", "My_Mutation_Log",
+]  # Multiverse_Model is left out so "import *" stays headless
+
+
+def __getattr__(name):
+    if name == "Multiverse_Model":  # Only the GUI pays for tkinter and ttkbootstrap
+        from .gui import Multiverse_Model
+        return Multiverse_Model
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
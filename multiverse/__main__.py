@@ -0,0 +1,23 @@
+"""Console example: python -m multiverse builds a small multiverse and prints it."""
+
+from .core import My_Multiverse
+
+
+def main():
+    multiverse = My_Multiverse(moduli=())
+    multiverse.add_universe(2, 6)
+    multiverse.add_universe(1, 6)
+    multiverse.add_universe(4, 12)
+    multiverse.add_universe(8, 24)
+    multiverse.add_universe(0, 2)
+    multiverse.add_universe(0, 4)
+    multiverse.add_universe(0, 6)
+    multiverse.add_universe(0, 8)
+    multiverse.add_universe(0, 12)
+    multiverse.remove_universe(8, 24)
+
+    multiverse.display_multiverse()
+
+
+if __name__ == "__main__":
+    main()
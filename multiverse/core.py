@@ -0,0 +1,736 @@
+"""The multiverse: universes connected by the transitions between their orbits."""
+
+import heapq
+
+from .graph import My_Compact_Directed_Graph, My_CSR_Graph, My_Directed_Graph
+from .storage import My_Multiverse_File
+from .structures import My_Dict, My_List, My_LRU_Cache, My_Set
+from .universe import My_Moduli_Lattice, My_Zn_Union, My_Zn_verse, _as_array, _numpy
+
+# Read-only modulus index installed in each connection-building worker process:
+# (residues {n: {a}}, multiples {n: (m, ...)}, arrival {(a, n): counter}, max_connections, rank)
+_worker_index = None
+
+
+def _init_connection_worker(index):
+    global _worker_index
+    _worker_index = index
+
+
+def _successor_pairs(residues, multiples, a, n):
+    """Yields the (a, n) pairs [a]ℤn can transition into; mirrors My_Multiverse._successors on plain data."""
+    for m in multiples[n]:
+        orbit = residues[m]
+        if m // n <= len(orbit):
+            for residue in range(a, m, n):
+                if residue in orbit:
+                    yield residue, m
+        else:
+            for residue in orbit:
+                if residue % n == a:
+                    yield residue, m
+
+
+def _connection_lists(sources):
+    """Pool task: returns [(a, n, [(a, n) of each connection, best ranked first]), ...] for the
+    (n, [a, ...]) orbit slices in sources, ranked exactly like My_Multiverse._connections_of."""
+    residues, multiples, arrival, max_connections, rank = _worker_index
+    results = []
+    for n, residue_list in sources:
+        for a in residue_list:
+            if rank is None:
+                key = arrival.__getitem__
+            else:
+                source = My_Zn_verse(a, n)
+                key = lambda pair: (rank(source, My_Zn_verse(*pair)), pair[1], pair[0])
+            results.append((a, n, heapq.nsmallest(max_connections, _successor_pairs(residues, multiples, a, n),
+                                                  key=key)))
+    return results
+
+class My_Multiverse:
+    # Serial connecting costs ~16 µs per source, while starting a pool and shipping the index to it costs
+    # 0.05 s (fork) to 0.5 s (spawn/forkserver); below this many sources the pool cannot pay for itself
+    _PARALLEL_MINIMUM = 1 << 16
+
+    def __init__(self, check_consistency=False, moduli=None, path_cache_size=1024, max_connections=6, rank=None,
+                 compact=False, workers=1):
+        # compact stores edges as int32 ids in pooled arrays (My_Compact_Directed_Graph)
+        self.graph = My_Compact_Directed_Graph() if compact else My_Directed_Graph()
+        self.max_connections = max_connections  # Most outgoing connections kept per universe
+        self.rank = rank  # rank(source, target) -> sort key, smallest kept first; None ranks by arrival
+        self.orbits = My_Dict()  # n -> My_Dict(a -> universe) for every universe on orbit n
+        self.lattice = My_Moduli_Lattice()  # Divisibility between the moduli of the orbits
+        self.arrival = My_Dict()  # universe -> insertion counter, used to rank connections
+        self.arrival_count = 0
+        self.check_consistency = check_consistency  # Verify against a full rebuild after every change
+        self.path_cache = My_LRU_Cache(path_cache_size)  # Recent path answers, cleared on every change
+        self.reachability = None  # My_Reachability_Index, built by the first reachable() query
+        self.log = None  # My_Mutation_Log that records every change, set by attach_log()
+        self.workers = workers  # Processes used to compute connections in bulk builds (1: serial)
+        self.initialize_multiverse(moduli)
+
+    @classmethod
+    def from_moduli(cls, moduli, check_consistency=False, max_connections=6, rank=None, compact=False, workers=1):
+        """Builds a multiverse holding every universe [a]ℤn for each modulus n in moduli."""
+        return cls(check_consistency=check_consistency, moduli=moduli, max_connections=max_connections, rank=rank,
+                   compact=compact, workers=workers)
+
+    @staticmethod
+    def rank_by_modulus_jump(source, target):
+        """Ranking that prefers the targets whose modulus is the smallest multiple of the source's."""
+        return target.n // source.n
+
+    def initialize_multiverse(self, moduli=None):
+        """Adds every residue of each modulus in moduli (the default orbits when None)."""
+        sets = My_List()  # Use My_List instead of a standard list
+        if moduli is None:
+            moduli = [2,3,4,6,8,9,12]
+        sets.extend(moduli)
+        self.add_moduli(sets)
+
+    def _predecessors(self, universe):
+        """Yields every universe that can transition into universe (one per divisor orbit)."""
+        a = universe.a
+        for divisor in self.lattice.divisors(universe.n):
+            orbit = self.orbits[divisor]
+            if a % divisor in orbit:
+                yield orbit[a % divisor]
+
+    def _successors(self, universe):
+        """Yields every universe that universe can transition into, using the orbit index.
+
+        Only orbits whose modulus is a multiple of universe.n are visited, and on each
+        of them only the residues congruent to universe.a."""
+        a, n = universe.a, universe.n
+        for m in self.lattice.multiples(n):
+            orbit = self.orbits[m]
+            if m // n <= len(orbit):
+                for residue in range(a, m, n):
+                    target = orbit.get(residue)
+                    if target is not None:
+                        yield target
+            else:  # Sparse orbit: cheaper to test the residues it actually has
+                for residue, target in orbit.items():
+                    if residue % n == a:
+                        yield target
+
+    def _rank_key(self, universe):
+        """Returns the sort key of the candidate connections of universe (smallest kept first).
+
+        Custom rankings are broken by (n, a) so the result never depends on insertion order."""
+        if self.rank is None:
+            return self.arrival.__getitem__
+        rank = self.rank
+        return lambda target: (rank(universe, target), target.n, target.a)
+
+    def _connections_of(self, universe):
+        """Returns a My_List of the (at most max_connections) best-ranked universes universe can transition into.
+
+        heapq.nsmallest keeps a bounded heap, so this costs O(candidates * log max_connections)."""
+        connections = My_List()
+        connections.extend(heapq.nsmallest(self.max_connections, self._successors(universe),
+                                           key=self._rank_key(universe)))
+        return connections
+
+    def _accepts(self, universe, target):
+        """Checks whether target would make it into the connections of universe if offered now."""
+        connections = self.graph.neighbors_view(universe)
+        if len(connections) < self.max_connections:
+            return True
+        if self.max_connections <= 0:
+            return False
+        key = self._rank_key(universe)
+        return key(target) < max(key(connection) for connection in connections)
+    
+    def _all_connections(self, universes, workers=None):
+        """Yields (universe, My_List of its connections) for every universe in universes.
+
+        With more than one worker (self.workers by default) and enough universes,
+        the sources are partitioned by modulus across a process pool. Every worker
+        gets one read-only copy of the modulus index and ranks its candidates exactly
+        as _connections_of does, so the result is identical to the serial one.
+        A custom rank must then be picklable (a module-level function or staticmethod)."""
+        if workers is None:
+            workers = self.workers
+        if workers <= 1 or len(universes) < self._PARALLEL_MINIMUM:
+            for universe in universes:
+                yield universe, self._connections_of(universe)
+            return
+
+        residues = {}
+        arrival = {}
+        for n, orbit in self.orbits.items():
+            residues[n] = set(orbit)
+            for a, universe in orbit.items():
+                arrival[(a, n)] = self.arrival[universe]
+        multiples = {n: tuple(self.lattice.multiples(n)) for n in residues}
+        index = (residues, multiples, arrival if self.rank is None else None, self.max_connections, self.rank)
+
+        by_modulus = My_Dict()  # n -> plain list of the residues to connect on orbit n
+        for universe in universes:
+            if universe.n not in by_modulus:
+                by_modulus[universe.n] = []
+            by_modulus[universe.n].append(universe.a)
+
+        # About four tasks per worker; a large orbit is split across several tasks
+        task_size = max(1, len(universes) // (4 * workers))
+        tasks = []
+        task, size = [], 0
+        for n, residue_list in by_modulus.items():
+            for start in range(0, len(residue_list), task_size):
+                part = residue_list[start:start + task_size]
+                task.append((n, part))
+                size += len(part)
+                if size >= task_size:
+                    tasks.append(task)
+                    task, size = [], 0
+        if len(task) > 0:
+            tasks.append(task)
+
+        from concurrent.futures import ProcessPoolExecutor  # Imported here to keep the package import cheap
+
+        computed = {}  # (a, n) -> [(a, n) of each connection]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_connection_worker,
+                                 initargs=(index,)) as pool:
+            for results in pool.map(_connection_lists, tasks):
+                for a, n, targets in results:
+                    computed[(a, n)] = targets
+
+        # Merge in the order of universes, so even the in-edge order matches a serial build
+        for universe in universes:
+            connections = My_List()
+            connections.extend(self.orbits[m][residue] for residue, m in computed[(universe.a, universe.n)])
+            yield universe, connections
+
+    def _create_connections(self, workers=None):
+        """Rebuild all valid connections between universes from scratch (in parallel with workers > 1)."""
+        for universe1, connections in self._all_connections(self.graph.get_vertices(), workers):
+            # Clear existing edges and add only unique connections
+            self.graph.set_neighbors(universe1, connections)
+        self._graph_changed()
+
+    def verify_connections(self):
+        """Checks every adjacency list against a brute-force rebuild that ignores the orbit and
+        lattice indexes, and the in-edges against the out-edges, raising RuntimeError on mismatch."""
+        vertices = self.graph.get_vertices()
+        mismatched = My_List()
+        expected_predecessors = My_Dict()  # universe -> My_Set of the universes with an edge into it
+        for universe in vertices:
+            expected_predecessors[universe] = My_Set()
+        for universe in vertices:
+            a, n = universe.a, universe.n
+            candidates = (target for target in vertices
+                          if target != universe and target.n % n == 0 and target.a % n == a)
+            expected = heapq.nsmallest(self.max_connections, candidates, key=self._rank_key(universe))
+            connections = self.graph.neighbors_view(universe)
+            if len(expected) != len(connections) or any(x != y for x, y in zip(expected, connections)):
+                mismatched.append(universe)
+            for target in connections:
+                if target in expected_predecessors:
+                    expected_predecessors[target].add(universe)
+        if len(mismatched) > 0:
+            raise RuntimeError(f"Connections differ from a full rebuild for {mismatched}")
+
+        for universe in vertices:
+            predecessors = self.graph.predecessors(universe)
+            expected = expected_predecessors[universe]
+            if len(predecessors) != len(expected) or any(p not in expected for p in predecessors):
+                mismatched.append(universe)
+        if len(mismatched) > 0:
+            raise RuntimeError(f"In-edges do not mirror the out-edges for {mismatched}")
+    
+    def _register(self, universe):
+        """Adds universe as a vertex (without edges) and records it in the orbit index."""
+        self.graph.add_vertex(universe)
+        if universe.n not in self.orbits:
+            self.orbits[universe.n] = My_Dict()
+            self.lattice.add_modulus(universe.n)
+        self.orbits[universe.n][universe.a] = universe
+        self.arrival[universe] = self.arrival_count
+        self.arrival_count += 1
+
+    def add_universe(self, a, n):
+        universe = My_Zn_verse(a, n)
+        if universe not in self.graph:
+            if self.log is not None:
+                self.log.append("add", a, n)
+            self._register(universe)
+
+            # Only the new universe and its predecessors on divisor orbits change;
+            # ranked by arrival, it is the worst candidate and only fits where there is room
+            self.graph.set_neighbors(universe, self._connections_of(universe))
+            evicted = False  # A full predecessor that accepts the universe drops another connection
+            for predecessor in self._predecessors(universe):
+                if self._accepts(predecessor, universe):
+                    if self.rank is None:
+                        self.graph.add_edge(predecessor, universe)
+                    else:
+                        evicted = evicted or self.graph.out_degree(predecessor) >= self.max_connections
+                        self.graph.set_neighbors(predecessor, self._connections_of(predecessor))
+            # The reachability index can only be extended in place when no edge was removed
+            self._graph_changed(added=None if evicted else universe)
+
+            if self.check_consistency:
+                self.verify_connections()
+
+    def add_universes(self, pairs):
+        """Adds every universe [a]ℤn for the (a, n) pairs in pairs in a single pass.
+
+        Duplicates (within pairs or already present) are skipped. All pairs are
+        validated before anything is added. Returns (universes_added, connections_added)."""
+        universes = My_List()
+        for a, n in pairs:
+            universes.append(My_Zn_verse(a, n))
+
+        self.lattice.add_moduli(My_Set(universe.n for universe in universes))  # One sieve for every new orbit
+
+        total = len(self.graph) + len(universes)
+        self.graph.reserve(total)
+        self.arrival.reserve(total)
+
+        added = My_List()
+        for universe in universes:
+            if universe not in self.graph:
+                if self.log is not None:
+                    self.log.append("add", universe.a, universe.n)
+                self._register(universe)
+                added.append(universe)
+
+        first_new = self.arrival_count - len(added)
+        connections_added = 0
+        predecessors = My_Set()  # Earlier universes whose connections may take in new targets
+        for universe in added:
+            if first_new > 0:  # Nothing to revisit when the multiverse started empty
+                for predecessor in self._predecessors(universe):
+                    if self.arrival[predecessor] < first_new and self._accepts(predecessor, universe):
+                        predecessors.add(predecessor)
+
+        for universe, connections in self._all_connections(added):
+            self.graph.set_neighbors(universe, connections)
+            connections_added += len(connections)
+
+        for predecessor in predecessors:
+            before = self.graph.out_degree(predecessor)
+            self.graph.set_neighbors(predecessor, self._connections_of(predecessor))
+            connections_added += self.graph.out_degree(predecessor) - before
+
+        if len(added) > 0:
+            self._graph_changed()
+
+        if self.check_consistency:
+            self.verify_connections()
+        return len(added), connections_added
+
+    def add_moduli(self, moduli):
+        """Adds every residue [0]ℤn .. [n-1]ℤn of each modulus n in moduli, like add_universes."""
+        return self.add_universes((a, n) for n in moduli for a in range(n))
+    
+    def remove_universe(self, a, n):
+        self.remove_universes([(a, n)])
+
+    def remove_universes(self, pairs):
+        """Removes every universe [a]ℤn for the (a, n) pairs in pairs in a single pass.
+
+        Only the edges touching removed universes are visited. Returns how many
+        universes were actually removed."""
+        universes = My_List()
+        for a, n in pairs:
+            universes.append(My_Zn_verse(a, n))
+        if self.log is not None:
+            for universe in universes:
+                if universe in self.graph:
+                    self.log.append("remove", universe.a, universe.n)
+        return self._remove_universes(universes)
+
+    def _remove_universes(self, universes):
+        """Removes the universes (My_Zn_verse objects) without logging; returns how many were present."""
+        removed = My_Set(universe for universe in universes if universe in self.graph)
+
+        # A surviving predecessor that was full may now have room for a target that was cut off
+        refill = My_Set()
+        for universe in removed:
+            for predecessor in self.graph.predecessors(universe):
+                if predecessor not in removed and self.graph.out_degree(predecessor) == self.max_connections:
+                    refill.add(predecessor)
+
+        self.graph.remove_vertices(removed)
+        for universe in removed:
+            orbit = self.orbits[universe.n]
+            del orbit[universe.a]
+            if len(orbit) == 0:
+                del self.orbits[universe.n]
+                self.lattice.remove_modulus(universe.n)
+            del self.arrival[universe]
+
+        for predecessor in refill:
+            self.graph.set_neighbors(predecessor, self._connections_of(predecessor))
+
+        if len(removed) > 0:
+            self._graph_changed()
+
+        if self.check_consistency:
+            self.verify_connections()
+        return len(removed)
+
+    def remove_orbit(self, n):
+        """Removes every universe on orbit n at once; returns how many were removed."""
+        orbit = self.orbits.get(n)
+        if orbit is None:
+            return 0
+        if self.log is not None:
+            self.log.append("remove_orbit", n)
+        universes = My_List()
+        universes.extend(universe for a, universe in orbit.items())
+        return self._remove_universes(universes)
+
+    def attach_log(self, log):
+        """Records every later change in the My_Mutation_Log log.
+
+        When log has nothing to start from yet (an empty file and no snapshot), the
+        current state is written first: as a snapshot if log has a snapshot path,
+        otherwise as one add event per universe."""
+        self.log = log
+        if log.is_empty() and not log.has_snapshot():
+            if log.snapshot_path is not None:
+                log.compact(self)
+            else:
+                for universe in self.graph.get_vertices():
+                    log.append("add", universe.a, universe.n)
+
+    @classmethod
+    def recover(cls, log, check_consistency=False, rank=None, compact=False):
+        """Rebuilds a multiverse from the snapshot of log plus the events recorded since, then attaches log."""
+        if log.has_snapshot():
+            multiverse = cls.load(log.snapshot_path, rank=rank, compact=compact)
+            with My_Multiverse_File(log.snapshot_path) as stored:
+                generation = stored.generation
+        else:
+            multiverse = cls(moduli=(), rank=rank, compact=compact)
+            generation = 0
+        log.replay(multiverse, generation=generation)
+        multiverse.attach_log(log)
+        multiverse.check_consistency = check_consistency
+        if check_consistency:
+            multiverse.verify_connections()
+        return multiverse
+
+    def get_related_universes(self, universe):
+        """Returns all universes related to the given universe."""
+        related = My_List()
+        
+        # Universes that have the current universe as a neighbor, in the order they were added
+        predecessors = self.graph.predecessors(universe)
+        related.extend(sorted(predecessors, key=self.arrival.__getitem__))
+        
+        # Also add any neighbors of the current universe that aren't already in the list
+        for neighbor in self.graph.neighbors_view(universe):
+            if neighbor not in predecessors:
+                related.append(neighbor)
+        
+        return related
+    
+    def locate(self, k):
+        """Returns a My_List of the universes containing the integer k (one lookup of k % n per orbit)."""
+        found = My_List()
+        if isinstance(k, int):
+            for n, orbit in self.orbits.items():
+                universe = orbit.get(k % n)
+                if universe is not None:
+                    found.append(universe)
+        return found
+
+    def locate_many(self, values):
+        """Returns a My_List holding, for each integer in values, the My_List of universes containing it.
+
+        With NumPy, each orbit classifies every value in one vectorized k % n pass."""
+        np = _numpy()
+        if np is None:
+            results = My_List()
+            results.extend(self.locate(k) for k in values)
+            return results
+
+        array = _as_array(np, values).ravel()
+        results = My_List()
+        if array.dtype.kind not in "iu":  # Python objects: classify them one at a time
+            results.extend(self.locate(k) for k in array.tolist())
+            return results
+        results.extend(My_List() for _ in range(len(array)))
+
+        for n, orbit in self.orbits.items():
+            residues = array % n
+            present = np.fromiter(orbit, dtype=np.int64, count=len(orbit))
+            if n <= 1 << 20:  # Small modulus: a dense lookup table of the residues on this orbit
+                table = np.zeros(n, dtype=bool)
+                table[present] = True
+                hits = np.nonzero(table[residues])[0]
+            else:
+                hits = np.nonzero(np.isin(residues, present))[0]
+            for i, residue in zip(hits.tolist(), residues[hits].tolist()):
+                results[i].append(orbit[residue])
+        return results
+
+    def stream(self, lower, upper, universes=None):
+        """Yields, in increasing order and without repeats, every k with lower <= k <= upper
+        that belongs to at least one of universes (every universe in the multiverse by default).
+
+        The members of each universe are merged lazily with a heap, so memory stays
+        proportional to the number of universes rather than the width of the bounds."""
+        if universes is None:
+            universes = self.graph.get_vertices()
+        return My_Zn_Union(*universes).stream(lower, upper)
+
+    def count(self, lower, upper, universes=None):
+        """Returns how many integers k with lower <= k <= upper belong to at least one of
+        universes (every universe in the multiverse by default), without enumerating them."""
+        if universes is None:
+            universes = self.graph.get_vertices()
+        return My_Zn_Union(*universes).count(lower, upper)
+
+    def _graph_changed(self, added=None):
+        """Drops cached query answers after a change; added is a single newly added universe."""
+        self.path_cache.clear()
+        if self.reachability is not None:
+            if added is not None:
+                self.reachability.universe_added(added)
+            else:
+                self.reachability.invalidate()
+        if self.log is not None:
+            self.log.changed(self)
+
+    def reachable(self, a1, n1, a2, n2):
+        """Checks whether [a2]ℤn2 can ever be reached from [a1]ℤn1, in O(1) from a closure index."""
+        source, target = self._path_endpoints(a1, n1, a2, n2)
+        if self.reachability is None:
+            self.reachability = My_Reachability_Index(self)
+        return self.reachability.reachable(source, target)
+
+    def _search_path(self, source, target, max_hops=None):
+        """Returns the shortest path from source to target as a tuple of universes, or None.
+
+        Bidirectional BFS: searches forward along out-edges and backward along
+        in-edges, each step expanding the smaller frontier by one whole level.
+        Gives up once no path of at most max_hops transitions can remain."""
+        if source == target:
+            return (source,)
+
+        forward = My_Dict()  # universe -> (previous universe on the path, hops from source)
+        backward = My_Dict()  # universe -> (next universe on the path, hops to target)
+        forward[source] = (None, 0)
+        backward[target] = (None, 0)
+        forward_frontier = My_List()
+        forward_frontier.append(source)
+        backward_frontier = My_List()
+        backward_frontier.append(target)
+        forward_depth = backward_depth = 0
+
+        while len(forward_frontier) > 0 and len(backward_frontier) > 0:
+            # Every path of forward_depth + backward_depth hops or fewer has been ruled out
+            if max_hops is not None and forward_depth + backward_depth >= max_hops:
+                return None
+
+            if len(forward_frontier) <= len(backward_frontier):
+                frontier, adjacency, seen, other = forward_frontier, self.graph.neighbors_view, forward, backward
+                forward_depth += 1
+                depth = forward_depth
+            else:
+                frontier, adjacency, seen, other = backward_frontier, self.graph.predecessors, backward, forward
+                backward_depth += 1
+                depth = backward_depth
+
+            next_frontier = My_List()
+            meeting, meeting_length = None, 0
+            for universe in frontier:
+                for neighbor in adjacency(universe):
+                    if neighbor in seen:
+                        continue
+                    seen[neighbor] = (universe, depth)
+                    next_frontier.append(neighbor)
+                    if neighbor in other:
+                        length = depth + other[neighbor][1]
+                        if meeting is None or length < meeting_length:
+                            meeting, meeting_length = neighbor, length
+
+            if meeting is not None:
+                path = My_List()
+                universe = meeting
+                while universe is not None:
+                    path.insert(0, universe)
+                    universe = forward[universe][0]
+                universe = backward[meeting][0]
+                while universe is not None:
+                    path.append(universe)
+                    universe = backward[universe][0]
+                return tuple(path)
+
+            if frontier is forward_frontier:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+        return None
+
+    def _path_endpoints(self, a1, n1, a2, n2):
+        """Returns the two universes of a path query, raising KeyError if either is missing."""
+        source, target = My_Zn_verse(a1, n1), My_Zn_verse(a2, n2)
+        for universe in (source, target):
+            if universe not in self.graph:
+                raise KeyError(f"Universe {universe} not found")
+        return source, target
+
+    def shortest_path(self, a1, n1, a2, n2):
+        """Returns a My_List with the shortest chain of transitions from [a1]ℤn1 to [a2]ℤn2, or None."""
+        source, target = self._path_endpoints(a1, n1, a2, n2)
+        key = (source, target)
+        if key in self.path_cache:
+            path = self.path_cache.get(key)
+        else:
+            path = self._search_path(source, target)
+            self.path_cache.put(key, path)
+
+        if path is None:
+            return None
+        result = My_List()
+        result.extend(path)
+        return result
+
+    def reachable_within(self, a1, n1, a2, n2, k):
+        """Checks whether [a2]ℤn2 can be reached from [a1]ℤn1 in at most k transitions."""
+        source, target = self._path_endpoints(a1, n1, a2, n2)
+        if (source, target) in self.path_cache:
+            path = self.path_cache.get((source, target))
+            return path is not None and len(path) - 1 <= k
+        if (source, target, k) in self.path_cache:
+            return self.path_cache.get((source, target, k))
+
+        path = self._search_path(source, target, max_hops=k)
+        if path is not None:
+            self.path_cache.put((source, target), path)  # A bounded search still finds a shortest path
+            return True
+        self.path_cache.put((source, target, k), False)
+        return False
+
+    def snapshot(self):
+        """Returns an immutable My_CSR_Graph of the multiverse whose ids are looked up by (a, n)."""
+        return My_CSR_Graph.from_graph(self.graph, key=lambda universe: (universe.a, universe.n))
+
+    def save(self, path, generation=0, durable=False):
+        """Writes the multiverse to path in the binary format read by load() and My_Multiverse_File.
+
+        generation is recorded for My_Mutation_Log; durable fsyncs the file before returning."""
+        My_Multiverse_File.write(path, self.snapshot(), self.max_connections, generation, durable)
+
+    @classmethod
+    def load(cls, path, check_consistency=False, max_connections=None, rank=None, compact=False):
+        """Rebuilds a multiverse saved with save(), reusing the stored connections instead of recomputing them.
+
+        This is still a full rebuild, O(V + E): every universe and adjacency row is
+        created, although each row is filled from the stored arrays in one step.
+        Read-only callers should open the file with My_Multiverse_File instead,
+        which maps it in O(1).
+
+        max_connections defaults to the saved cap. The ranking is not stored, so pass
+        the rank the multiverse was built with (a different one is applied from the next change on)."""
+        with My_Multiverse_File(path) as stored:
+            if max_connections is None:
+                max_connections = stored.max_connections
+            multiverse = cls(moduli=(), max_connections=max_connections, rank=rank, compact=compact)
+            count = stored.vertex_count()
+            universes = My_List()
+            universes.reserve(count)
+            for i in range(count):
+                universes.append(My_Zn_verse(*stored.universe(i)))
+
+            multiverse.graph.load_csr(universes, stored.offsets, stored.targets, stored.in_offsets, stored.sources)
+
+            # Orbit sizes are runs of equal n in the (n, a)-sorted ids, so each orbit is allocated once
+            sizes = My_Dict()
+            start = 0
+            for i in range(1, count + 1):
+                if i == count or universes[stored.order[i]].n != universes[stored.order[start]].n:
+                    sizes[universes[stored.order[start]].n] = i - start
+                    start = i
+            multiverse.lattice.add_moduli(sizes)
+            multiverse.arrival.reserve(count)
+            for universe in universes:  # Stored in arrival order
+                orbit = multiverse.orbits.get(universe.n)
+                if orbit is None:
+                    orbit = multiverse.orbits[universe.n] = My_Dict()
+                    orbit.reserve(sizes[universe.n])
+                orbit[universe.a] = universe
+                multiverse.arrival[universe] = multiverse.arrival_count
+                multiverse.arrival_count += 1
+
+        multiverse.check_consistency = check_consistency
+        if check_consistency:
+            multiverse.verify_connections()
+        return multiverse
+
+    def display_multiverse(self):
+        self.graph.display()
+
+class My_Reachability_Index:
+    """Transitive closure of a My_Multiverse stored as Python-int bitsets.
+
+    Universes get compact ids; bit j of reach[i] is set when the universe with
+    id j can be reached from the universe with id i (each reaches itself)."""
+
+    def __init__(self, multiverse):
+        self.multiverse = multiverse
+        self.ids = My_Dict()  # universe -> compact id
+        self.reach = My_List()  # id -> bitset of reachable ids
+        self.stale = True  # Rebuilt on the next query
+
+    def invalidate(self):
+        """Marks the index for a full rebuild (after removals or bulk changes)."""
+        self.stale = True
+
+    def rebuild(self):
+        """Recomputes every reachable set with one bitset union per edge."""
+        graph = self.multiverse.graph
+        vertices = graph.get_vertices()
+        self.ids = My_Dict()
+        self.ids.reserve(len(vertices))
+        for universe in vertices:
+            self.ids[universe] = len(self.ids)
+
+        # Transitions always go to a strictly larger modulus, so visiting orbits from
+        # the largest modulus down is a reverse topological order of the DAG
+        reach = [0] * len(vertices)
+        for n in sorted(self.multiverse.orbits, reverse=True):
+            for a, universe in self.multiverse.orbits[n].items():
+                i = self.ids[universe]
+                bits = 1 << i
+                for successor in graph.neighbors_view(universe):
+                    bits |= reach[self.ids[successor]]
+                reach[i] = bits
+
+        self.reach = My_List()
+        self.reach.extend(reach)
+        self.stale = False
+
+    def universe_added(self, universe):
+        """Extends the index for a universe just added with add_universe."""
+        if self.stale:
+            return
+        graph = self.multiverse.graph
+        i = len(self.reach)
+        self.ids[universe] = i
+        bits = 1 << i
+        for successor in graph.neighbors_view(universe):
+            bits |= self.reach[self.ids[successor]]
+        self.reach.append(bits)
+
+        # Everything that reaches the new universe now also reaches its closure
+        pending = My_List()
+        pending.extend(graph.predecessors(universe))
+        while len(pending) > 0:
+            ancestor = pending.pop()
+            j = self.ids[ancestor]
+            if self.reach[j] | bits != self.reach[j]:
+                self.reach[j] = self.reach[j] | bits
+                pending.extend(graph.predecessors(ancestor))
+
+    def reachable(self, source, target):
+        """Checks whether target can be reached from source."""
+        if self.stale:
+            self.rebuild()
+        return (self.reach[self.ids[source]] >> self.ids[target]) & 1 == 1
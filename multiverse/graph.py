@@ -0,0 +1,543 @@
+"""Directed graphs: My_Set adjacency, compact pooled-array adjacency and frozen CSR snapshots."""
+
+import ctypes
+from array import array
+
+from .structures import My_Dict, My_List, My_Set
+
+class My_Directed_Graph:
+    def __init__(self):
+        """Initialize an empty adjacency list using My_Dict."""
+        self.graph = My_Dict()  # vertex -> My_Set of vertices it has an edge to
+        self.in_edges = My_Dict()  # vertex -> My_Set of vertices with an edge into it
+
+    def add_vertex(self, vertex):
+        """Add a vertex to the graph if it doesn't already exist."""
+        if vertex not in self.graph:
+            self.graph[vertex] = My_Set()
+            self.in_edges[vertex] = My_Set()
+
+    def add_edge(self, from_vertex, to_vertex):
+        """Add a directed edge from one vertex to another (duplicate edges are ignored)."""
+        if from_vertex not in self.graph:
+            self.add_vertex(from_vertex)
+        if to_vertex not in self.graph:
+            self.add_vertex(to_vertex)
+        if self.graph[from_vertex].add(to_vertex):
+            self.in_edges[to_vertex].add(from_vertex)
+
+    def set_neighbors(self, vertex, neighbors):
+        """Replace the adjacency list of vertex with the vertices in neighbors."""
+        self.add_vertex(vertex)
+        if len(self.graph[vertex]) > 0:
+            for neighbor in self.graph[vertex]:
+                self.in_edges[neighbor].discard(vertex)
+            self.graph[vertex] = My_Set()
+        for neighbor in neighbors:
+            self.add_edge(vertex, neighbor)
+
+    def load_csr(self, vertices, offsets, targets, in_offsets, sources):
+        """Fills an empty graph from CSR arrays over the positions in vertices (the layout of
+        My_CSR_Graph), building each row at once instead of edge by edge."""
+        self.reserve(len(vertices))
+        for i in range(len(vertices)):
+            self.graph[vertices[i]] = My_Set(vertices[j] for j in targets[offsets[i]:offsets[i + 1]])
+            self.in_edges[vertices[i]] = My_Set(vertices[j] for j in sources[in_offsets[i]:in_offsets[i + 1]])
+
+    def remove_edge(self, from_vertex, to_vertex):
+        """Remove a specific directed edge from the graph."""
+        if from_vertex in self.graph and self.graph[from_vertex].discard(to_vertex):
+            self.in_edges[to_vertex].discard(from_vertex)
+
+    def remove_vertex(self, vertex):
+        """Remove a vertex and all edges pointing to it, touching only its own neighbors."""
+        if vertex in self.graph:
+            for neighbor in self.graph.pop(vertex):
+                if neighbor != vertex:
+                    self.in_edges[neighbor].discard(vertex)
+            for predecessor in self.in_edges.pop(vertex):
+                if predecessor != vertex:
+                    self.graph[predecessor].discard(vertex)
+
+    def remove_vertices(self, vertices):
+        """Remove several vertices and every edge touching them, visiting each such edge once."""
+        doomed = My_Set(vertex for vertex in vertices if vertex in self.graph)
+        for vertex in doomed:
+            for neighbor in self.graph[vertex]:
+                if neighbor not in doomed:
+                    self.in_edges[neighbor].discard(vertex)
+            for predecessor in self.in_edges[vertex]:
+                if predecessor not in doomed:
+                    self.graph[predecessor].discard(vertex)
+        for vertex in doomed:
+            del self.graph[vertex]
+            del self.in_edges[vertex]
+
+    def __contains__(self, vertex):
+        """Checks if vertex is in the graph."""
+        return vertex in self.graph
+
+    def __len__(self):
+        """Returns the number of vertices."""
+        return len(self.graph)
+
+    def reserve(self, count):
+        """Makes room for count vertices in total without rehashing."""
+        self.graph.reserve(count)
+        self.in_edges.reserve(count)
+
+    def predecessors(self, vertex):
+        """Returns a read-only My_Set_View of the vertices with an edge into vertex."""
+        predecessors = self.in_edges.get(vertex)
+        if predecessors is None:
+            predecessors = My_Set()
+        return predecessors.view()
+
+    def in_degree(self, vertex):
+        """Returns the number of edges pointing into vertex."""
+        predecessors = self.in_edges.get(vertex)
+        return 0 if predecessors is None else len(predecessors)
+
+    def out_degree(self, vertex):
+        """Returns the number of edges leaving vertex."""
+        neighbors = self.graph.get(vertex)
+        return 0 if neighbors is None else len(neighbors)
+
+    def has_edge(self, from_vertex, to_vertex):
+        """Check if an edge exists between two vertices."""
+        return from_vertex in self.graph and to_vertex in self.graph[from_vertex]
+
+    def get_vertices(self):
+        """Return a My_List of all vertices in the graph."""
+        return self.graph.keys()
+
+    def get_edges(self):
+        """Return a My_List of all directed edges in the graph."""
+        edges = My_List()
+        for vertex, neighbors in self.graph.items():
+            for neighbor in neighbors:
+                edges.append((vertex, neighbor))
+        return edges  # Now returns a My_List
+        
+    def get_neighbors(self, vertex):
+        """Returns a My_List of neighbors for a given vertex."""
+        neighbors = My_List()
+        if vertex in self.graph:
+            neighbors.extend(self.graph[vertex])
+        return neighbors
+
+    def neighbors_view(self, vertex):
+        """Returns a read-only My_Set_View of the neighbors of vertex; it reflects later changes."""
+        neighbors = self.graph.get(vertex)
+        if neighbors is None:
+            neighbors = My_Set()
+        return neighbors.view()
+
+    def freeze(self):
+        """Returns an immutable My_CSR_Graph snapshot of the graph, built in O(V+E)."""
+        return My_CSR_Graph.from_graph(self)
+
+    def display(self):
+        """Display the adjacency list of the graph."""
+        print("Graph Representation (Adjacency List):")
+        for vertex in self.graph:
+            print(f"{vertex} --> {(self.graph[vertex])}")  # Convert to list for better readability
+
+    def display_vertex_connections(self, vertex):
+        """Return a string with the adjacency list of one vertex in the graph"""
+        str = f"{vertex} --> {self.graph[vertex]}"
+        return str
+
+class My_Row_Pool:
+    """Variable-length rows of integer ids packed into one pooled array('i') buffer.
+
+    Row i owns pool[offsets[i]:offsets[i] + capacities[i]], of which the first
+    lengths[i] slots are used. A row that outgrows its capacity moves to the end
+    of the pool; the pool is compacted once such holes make up half of it."""
+
+    _MIN_CAPACITY = 2
+
+    def __init__(self):
+        self.pool = array("i")
+        self.offsets = array("q")
+        self.lengths = array("i")
+        self.capacities = array("i")
+        self.live = 0  # Pool slots owned by rows; the rest are holes
+
+    def _extend_pool(self, count):
+        """Appends count zeroed slots to the pool."""
+        self.pool.frombytes(bytes(count * self.pool.itemsize))
+
+    def ensure_row(self, i):
+        """Makes row i exist and be empty (row ids are dense, so i is at most the row count)."""
+        if i == len(self.offsets):
+            self.offsets.append(len(self.pool))
+            self.lengths.append(0)
+            self.capacities.append(0)
+        else:
+            self.lengths[i] = 0
+
+    def load(self, offsets, values):
+        """Replaces every row at once: row i becomes values[offsets[i]:offsets[i + 1]] (int64
+        offsets and int32 values, e.g. memoryviews into a saved file)."""
+        self.pool = array("i")
+        self.pool.frombytes(memoryview(values).cast("B"))
+        self.offsets = array("q")
+        self.offsets.frombytes(memoryview(offsets)[:len(offsets) - 1].cast("B"))
+        self.lengths = array("i", (offsets[i + 1] - offsets[i] for i in range(len(offsets) - 1)))
+        self.capacities = array("i", self.lengths)
+        self.live = len(self.pool)
+
+    def release(self, i):
+        """Empties row i and hands its slots back to the pool."""
+        self.live -= self.capacities[i]
+        self.lengths[i] = 0
+        self.capacities[i] = 0
+
+    def row(self, i):
+        """Returns a copy of the ids in row i."""
+        start = self.offsets[i]
+        return self.pool[start:start + self.lengths[i]]
+
+    def contains(self, i, value):
+        """Checks whether value is in row i."""
+        start = self.offsets[i]
+        try:
+            self.pool.index(value, start, start + self.lengths[i])
+        except ValueError:
+            return False
+        return True
+
+    def append(self, i, value):
+        """Appends value to row i, moving the row if it is full."""
+        if self.lengths[i] == self.capacities[i]:
+            self._grow(i)
+        self.pool[self.offsets[i] + self.lengths[i]] = value
+        self.lengths[i] += 1
+
+    def remove(self, i, value):
+        """Removes value from row i, keeping the order of the others; returns True if it was there."""
+        start = self.offsets[i]
+        end = start + self.lengths[i]
+        try:
+            j = self.pool.index(value, start, end)
+        except ValueError:
+            return False
+        self.pool[j:end - 1] = self.pool[j + 1:end]
+        self.lengths[i] -= 1
+        return True
+
+    def clear(self, i):
+        """Empties row i but keeps its capacity."""
+        self.lengths[i] = 0
+
+    def _grow(self, i):
+        """Doubles the capacity of row i, in place when it is the last row of the pool."""
+        if len(self.pool) > 2 * self.live + 64:
+            self.compact()
+        capacity = self.capacities[i]
+        new_capacity = max(self._MIN_CAPACITY, 2 * capacity)
+        start = self.offsets[i]
+        if start + capacity == len(self.pool):
+            self._extend_pool(new_capacity - capacity)
+        else:
+            self.offsets[i] = len(self.pool)
+            self.pool.extend(self.pool[start:start + self.lengths[i]])
+            self._extend_pool(new_capacity - self.lengths[i])
+        self.capacities[i] = new_capacity
+        self.live += new_capacity - capacity
+
+    def compact(self):
+        """Rewrites the pool without holes, trimming every row to its length."""
+        pool = array("i")
+        for i in range(len(self.offsets)):
+            start = self.offsets[i]
+            self.offsets[i] = len(pool)
+            pool.extend(self.pool[start:start + self.lengths[i]])
+            self.capacities[i] = self.lengths[i]
+        self.pool = pool
+        self.live = len(pool)
+
+    def nbytes(self):
+        """Returns the bytes held by the pool and the per-row bookkeeping arrays."""
+        return sum(len(part) * part.itemsize for part in (self.pool, self.offsets, self.lengths, self.capacities))
+
+class My_Row_View:
+    """Read-only window onto one row of a My_Compact_Directed_Graph, as vertices."""
+
+    def __init__(self, graph, rows, vertex_id):
+        self.graph = graph
+        self.rows = rows
+        self.vertex_id = vertex_id
+
+    def __contains__(self, vertex):
+        vertex_id = self.graph.ids.get(vertex)
+        return vertex_id is not None and self.rows.contains(self.vertex_id, vertex_id)
+
+    def __len__(self):
+        return self.rows.lengths[self.vertex_id]
+
+    def __iter__(self):
+        vertices = self.graph.vertices
+        for vertex_id in self.rows.row(self.vertex_id):
+            yield vertices[vertex_id]
+
+    def __repr__(self):
+        return f"([{', '.join(repr(vertex) for vertex in self)}])"
+
+class My_Compact_Directed_Graph:
+    """My_Directed_Graph with the same public methods but compact storage.
+
+    Vertices are mapped to dense integer ids and every edge is stored as two
+    int32 ids (one per direction) in pooled My_Row_Pool buffers, instead of two
+    references held in per-vertex My_Sets. Membership tests and removals scan
+    a row, so they cost O(degree) rather than O(1)."""
+
+    def __init__(self):
+        self.ids = My_Dict()  # vertex -> id
+        self.vertices = My_List()  # id -> vertex (None for a free id)
+        self.free_ids = My_List()  # Ids of removed vertices, reused first
+        self.out_rows = My_Row_Pool()  # id -> ids it has an edge to
+        self.in_rows = My_Row_Pool()  # id -> ids with an edge into it
+
+    def add_vertex(self, vertex):
+        """Add a vertex to the graph if it doesn't already exist."""
+        if vertex in self.ids:
+            return
+        if len(self.free_ids) > 0:
+            vertex_id = self.free_ids.pop()
+            self.vertices[vertex_id] = vertex
+        else:
+            vertex_id = len(self.vertices)
+            self.vertices.append(vertex)
+        self.ids[vertex] = vertex_id
+        self.out_rows.ensure_row(vertex_id)
+        self.in_rows.ensure_row(vertex_id)
+
+    def add_edge(self, from_vertex, to_vertex):
+        """Add a directed edge from one vertex to another (duplicate edges are ignored)."""
+        self.add_vertex(from_vertex)
+        self.add_vertex(to_vertex)
+        from_id, to_id = self.ids[from_vertex], self.ids[to_vertex]
+        if not self.out_rows.contains(from_id, to_id):
+            self.out_rows.append(from_id, to_id)
+            self.in_rows.append(to_id, from_id)
+
+    def set_neighbors(self, vertex, neighbors):
+        """Replace the adjacency list of vertex with the vertices in neighbors."""
+        neighbors = list(neighbors)  # neighbors may be a live view of the row cleared below
+        self.add_vertex(vertex)
+        vertex_id = self.ids[vertex]
+        for neighbor_id in self.out_rows.row(vertex_id):
+            self.in_rows.remove(neighbor_id, vertex_id)
+        self.out_rows.clear(vertex_id)
+        for neighbor in neighbors:
+            self.add_edge(vertex, neighbor)
+
+    def load_csr(self, vertices, offsets, targets, in_offsets, sources):
+        """Fills an empty graph from CSR arrays over the positions in vertices (the layout of
+        My_CSR_Graph); positions become the ids and the arrays are copied into the pools whole."""
+        self.reserve(len(vertices))
+        for i in range(len(vertices)):
+            self.ids[vertices[i]] = i
+        self.vertices.extend(vertices)
+        self.out_rows.load(offsets, targets)
+        self.in_rows.load(in_offsets, sources)
+
+    def remove_edge(self, from_vertex, to_vertex):
+        """Remove a specific directed edge from the graph."""
+        from_id, to_id = self.ids.get(from_vertex), self.ids.get(to_vertex)
+        if from_id is not None and to_id is not None and self.out_rows.remove(from_id, to_id):
+            self.in_rows.remove(to_id, from_id)
+
+    def remove_vertex(self, vertex):
+        """Remove a vertex and all edges pointing to it, touching only its own neighbors."""
+        self.remove_vertices((vertex,))
+
+    def remove_vertices(self, vertices):
+        """Remove several vertices and every edge touching them, visiting each such edge once."""
+        doomed = My_Set(self.ids[vertex] for vertex in vertices if vertex in self.ids)
+        for vertex_id in doomed:
+            for neighbor_id in self.out_rows.row(vertex_id):
+                if neighbor_id not in doomed:
+                    self.in_rows.remove(neighbor_id, vertex_id)
+            for predecessor_id in self.in_rows.row(vertex_id):
+                if predecessor_id not in doomed:
+                    self.out_rows.remove(predecessor_id, vertex_id)
+        for vertex_id in doomed:
+            self.out_rows.release(vertex_id)
+            self.in_rows.release(vertex_id)
+            del self.ids[self.vertices[vertex_id]]
+            self.vertices[vertex_id] = None
+            self.free_ids.append(vertex_id)
+
+    def __contains__(self, vertex):
+        """Checks if vertex is in the graph."""
+        return vertex in self.ids
+
+    def __len__(self):
+        """Returns the number of vertices."""
+        return len(self.ids)
+
+    def reserve(self, count):
+        """Makes room for count vertices in total without rehashing."""
+        self.ids.reserve(count)
+        self.vertices.reserve(count)
+
+    def _row_view(self, rows, vertex):
+        vertex_id = self.ids.get(vertex)
+        if vertex_id is None:
+            return My_Set().view()
+        return My_Row_View(self, rows, vertex_id)
+
+    def predecessors(self, vertex):
+        """Returns a read-only view of the vertices with an edge into vertex."""
+        return self._row_view(self.in_rows, vertex)
+
+    def in_degree(self, vertex):
+        """Returns the number of edges pointing into vertex."""
+        vertex_id = self.ids.get(vertex)
+        return 0 if vertex_id is None else self.in_rows.lengths[vertex_id]
+
+    def out_degree(self, vertex):
+        """Returns the number of edges leaving vertex."""
+        vertex_id = self.ids.get(vertex)
+        return 0 if vertex_id is None else self.out_rows.lengths[vertex_id]
+
+    def has_edge(self, from_vertex, to_vertex):
+        """Check if an edge exists between two vertices."""
+        from_id, to_id = self.ids.get(from_vertex), self.ids.get(to_vertex)
+        return from_id is not None and to_id is not None and self.out_rows.contains(from_id, to_id)
+
+    def get_vertices(self):
+        """Return a My_List of all vertices in the graph."""
+        return self.ids.keys()
+
+    def get_edges(self):
+        """Return a My_List of all directed edges in the graph."""
+        edges = My_List()
+        for vertex in self.ids:
+            for neighbor in self.neighbors_view(vertex):
+                edges.append((vertex, neighbor))
+        return edges
+
+    def get_neighbors(self, vertex):
+        """Returns a My_List of neighbors for a given vertex."""
+        neighbors = My_List()
+        neighbors.extend(self._row_view(self.out_rows, vertex))
+        return neighbors
+
+    def neighbors_view(self, vertex):
+        """Returns a read-only view of the neighbors of vertex; it reflects later changes."""
+        return self._row_view(self.out_rows, vertex)
+
+    def freeze(self):
+        """Returns an immutable My_CSR_Graph snapshot of the graph, built in O(V+E)."""
+        return My_CSR_Graph.from_graph(self)
+
+    def nbytes(self):
+        """Returns the bytes held by the two edge pools."""
+        return self.out_rows.nbytes() + self.in_rows.nbytes()
+
+    def display(self):
+        """Display the adjacency list of the graph."""
+        print("Graph Representation (Adjacency List):")
+        for vertex in self.ids:
+            print(f"{vertex} --> {self.neighbors_view(vertex)}")
+
+    def display_vertex_connections(self, vertex):
+        """Return a string with the adjacency list of one vertex in the graph"""
+        return f"{vertex} --> {self.neighbors_view(vertex)}"
+
+
+class My_CSR_Graph:
+    """Immutable compressed-sparse-row snapshot of a My_Directed_Graph.
+
+    Vertices get dense integer ids (in insertion order). The out-neighbors of
+    vertex i are targets[offsets[i]:offsets[i + 1]] and its predecessors are
+    sources[in_offsets[i]:in_offsets[i + 1]], all held in flat ctypes arrays."""
+
+    def __init__(self, vertices, ids, offsets, targets, in_offsets, sources):
+        self.vertices = vertices  # My_List: id -> vertex
+        self.ids = ids  # My_Dict: key -> id
+        self.offsets = offsets
+        self.targets = targets
+        self.in_offsets = in_offsets
+        self.sources = sources
+
+    @classmethod
+    def from_graph(cls, graph, key=None):
+        """Builds a snapshot of graph in O(V+E); ids are looked up by key(vertex) (the vertex by default)."""
+        vertices = graph.get_vertices()
+        count = len(vertices)
+        ids = My_Dict()
+        ids.reserve(count)
+        for i in range(count):
+            ids[vertices[i] if key is None else key(vertices[i])] = i
+
+        offsets = [0]
+        targets = []
+        in_counts = [0] * (count + 1)
+        for vertex in vertices:
+            for neighbor in graph.neighbors_view(vertex):
+                target = ids[neighbor if key is None else key(neighbor)]
+                targets.append(target)
+                in_counts[target + 1] += 1
+            offsets.append(len(targets))
+
+        # Counting sort of the edges by target gives the reverse (predecessor) rows
+        for i in range(count):
+            in_counts[i + 1] += in_counts[i]
+        in_offsets = list(in_counts)
+        sources = [0] * len(targets)
+        for source in range(count):
+            for e in range(offsets[source], offsets[source + 1]):
+                target = targets[e]
+                sources[in_counts[target]] = source
+                in_counts[target] += 1
+
+        return cls(vertices, ids,
+                   ((count + 1) * ctypes.c_int64)(*offsets),
+                   (len(targets) * ctypes.c_int32)(*targets),
+                   ((count + 1) * ctypes.c_int64)(*in_offsets),
+                   (len(sources) * ctypes.c_int32)(*sources))
+
+    def vertex_count(self):
+        """Returns the number of vertices."""
+        return len(self.offsets) - 1
+
+    def edge_count(self):
+        """Returns the number of directed edges."""
+        return len(self.targets)
+
+    def id_of(self, key):
+        """Returns the integer id of a vertex key, raising KeyError if absent."""
+        return self.ids[key]
+
+    def vertex(self, vertex_id):
+        """Returns the vertex object with the given id."""
+        return self.vertices[vertex_id]
+
+    def degree(self, vertex_id):
+        """Returns the out-degree of a vertex id."""
+        return self.offsets[vertex_id + 1] - self.offsets[vertex_id]
+
+    def in_degree(self, vertex_id):
+        """Returns the in-degree of a vertex id."""
+        return self.in_offsets[vertex_id + 1] - self.in_offsets[vertex_id]
+
+    def neighbors(self, vertex_id):
+        """Returns a list with the ids vertex_id has an edge to."""
+        return self.targets[self.offsets[vertex_id]:self.offsets[vertex_id + 1]]
+
+    def predecessors(self, vertex_id):
+        """Returns a list with the ids that have an edge into vertex_id."""
+        return self.sources[self.in_offsets[vertex_id]:self.in_offsets[vertex_id + 1]]
+
+    def edges(self):
+        """Yields every edge as a (source_id, target_id) pair."""
+        offsets = self.offsets
+        targets = self.targets
+        for source in range(self.vertex_count()):
+            for e in range(offsets[source], offsets[source + 1]):
+                yield source, targets[e]
@@ -0,0 +1,336 @@
+"""Tk visualisation of a multiverse; importing this module loads tkinter and ttkbootstrap."""
+
+import math
+import os
+import time
+import tkinter as tk
+from tkinter import messagebox
+
+import ttkbootstrap as ttk
+
+from .core import My_Multiverse
+from .structures import My_Dict, My_List
+from .universe import My_Zn_verse
+
+class Multiverse_Model:
+    def __init__(self, snapshot_path=None):
+        self.snapshot_path = snapshot_path  # Multiverse file loaded at startup and saved on close
+        self.root = ttk.Window(themename="darkly")
+        self.root.title("THE ZN-VERSE")
+        
+        self.canvas = ttk.Canvas(self.root, bg="black", width=800, height=600)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        screen_width = self.root.winfo_screenwidth()
+        screen_height = self.root.winfo_screenheight()
+
+        window_width = 850
+        window_height = 850
+
+        _x = (screen_width - window_width) // 2
+        _y = (screen_height - window_height - 70) // 2
+
+        self.root.geometry(f"{window_width}x{window_height}+{_x}+{_y}")
+        
+        if snapshot_path is not None and os.path.exists(snapshot_path):
+            self.multiverse = My_Multiverse.load(snapshot_path)
+        else:
+            self.multiverse = My_Multiverse()
+        self.universe_objects = My_Dict()
+        self.orbits = My_Dict()
+        self.labels = My_Dict()
+        self.base_radii = My_Dict()
+        self.base_periods = My_Dict()
+        self.start_times = My_Dict()
+        self.scale_factor = 1.0
+        self.start_time = time.time()
+        
+        self.mod_uno = self.canvas.create_oval(390, 290, 410, 310, fill="white", outline="white")
+        
+        self.canvas.bind("<ButtonPress-1>", self.start_pan)
+        self.canvas.bind("<B1-Motion>", self.pan)
+        self.canvas.bind("<MouseWheel>", self.zoom)
+        
+        self.universe_traveler_frame = ttk.Frame(self.root)
+        self.universe_traveler_frame.pack(side=tk.LEFT, fill=tk.Y)
+        ttk.Label(self.universe_traveler_frame, text="Universe connections:").pack()
+        ttk.Label(self.universe_traveler_frame, text="Insert universe to find connections:").pack()
+        
+        self.travel_entry_frame = ttk.Frame(self.universe_traveler_frame)
+        self.travel_entry_frame.pack()
+
+        ttk.Label(self.travel_entry_frame).pack(side="left", padx=10)
+        ttk.Label(self.travel_entry_frame, text="[").pack(side="left")
+        self.universe_a_entry = ttk.Entry(self.travel_entry_frame)
+        self.universe_a_entry.pack(side="left", pady=4)
+        ttk.Label(self.travel_entry_frame, text="]").pack(side="left")
+        ttk.Label(self.travel_entry_frame, text="ℤ").pack(side="left")
+        self.universe_zn_entry = ttk.Entry(self.travel_entry_frame)
+        self.universe_zn_entry.pack(side="left", pady=4)
+        ttk.Label(self.travel_entry_frame).pack(side="left", padx=10)
+
+        self.find_connection_btn = ttk.Button(self.universe_traveler_frame, text="Find connections", command=self.get_universe_on_entry)
+        self.find_connection_btn.pack(pady=6)
+
+        self.reset_connection_btn = ttk.Button(self.universe_traveler_frame, text="Reset connections", command=self.reset_connections)
+        self.reset_connection_btn.pack(pady=6)
+
+        self.universe_manager_frame = ttk.Frame(self.root)
+        self.universe_manager_frame.pack(side=tk.LEFT, fill=tk.Y)
+        
+        ttk.Label(self.universe_manager_frame, text="Manage Universes:").pack()
+        
+        self.orbit_frame = ttk.Frame(self.universe_manager_frame)
+        self.orbit_frame.pack()
+        self.orbit_label = ttk.Label(self.orbit_frame, text="Insert value for universe's orbit (modulo) -->")
+        self.orbit_label.pack(side="left")
+        self.orbit_entry = ttk.Entry(self.orbit_frame)
+        self.orbit_entry.pack(side="right")
+        
+        self.universe_frame = ttk.Frame(self.universe_manager_frame)
+        self.universe_frame.pack()
+        self.universe_label = ttk.Label(self.universe_frame, text="Insert value for universe's (equivalence class)")
+        self.universe_label.pack(side="left")
+        self.universe_entry = ttk.Entry(self.universe_frame)
+        self.universe_entry.pack(side="right")
+        
+        self.add_universe_btn = ttk.Button(self.universe_manager_frame, text="Add Universe", command=self.add_universe)
+        self.add_universe_btn.pack(pady=6)
+        self.remove_planet_btn = ttk.Button(self.universe_manager_frame, text="Remove Universe", command=self.remove_universe)
+        self.remove_planet_btn.pack(pady=3)
+
+        self.remove_orbit_btn = ttk.Button(self.universe_manager_frame, text="Remove Orbit", command=self.remove_orbit)
+        self.remove_orbit_btn.pack(pady=6)
+        
+        self.last_update_time = time.time()
+
+        self.initialize_universes()
+        self.update_universes()
+
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
+        self.root.bind("<Escape>", lambda event: self.on_close())
+
+        self.selected_universes = My_List()  # Track selected universes
+        self.original_colors = {}  # Store original colors of universes
+
+
+    def initialize_universes(self):
+        """Draws all universes stored in My_Multiverse at startup."""
+        self.multiverse.display_multiverse()
+        for universe in self.multiverse.graph.get_vertices():  
+            self.draw_universe(universe.a, universe.n)  # Just draw, don't re-add
+
+    def find_universe_connections(self, universe):
+        # Get all related universes
+        related_universes = self.multiverse.get_related_universes(universe)
+        print(related_universes)
+
+        # 🔹 Ensure the universe exists in the canvas
+        n, a = universe.n, universe.a
+        if (n in self.universe_objects) and (a in self.universe_objects[n]):
+            # Store the original color
+            self.original_colors[(n, a)] = self.canvas.itemcget(self.universe_objects[n][a], "fill")
+            # Highlight selected universe in white
+            self.canvas.itemconfig(self.universe_objects[n][a], fill="white")
+            self.selected_universes.append(My_Zn_verse(a, n))
+        else:
+            print(f"Warning: Universe {universe} not found in universe_objects.")
+
+        # 🔹 Highlight related universes in cyan
+        for related_universe in related_universes:
+            rn, ra = related_universe.n, related_universe.a
+            if (rn in self.universe_objects) and (ra in self.universe_objects[rn]):
+                # Store the original color
+                self.original_colors[(rn, ra)] = self.canvas.itemcget(self.universe_objects[rn][ra], "fill")
+                # Change to cyan
+                self.canvas.itemconfig(self.universe_objects[rn][ra], fill="red")
+                self.selected_universes.append(My_Zn_verse(ra, rn))
+            else:
+                print(f"Warning: Related universe {related_universe} not found in universe_objects.")
+
+        # 🔹 Get and display connections
+        the_message = self.multiverse.graph.display_vertex_connections(universe)
+        messagebox.showinfo(title=f"{repr(universe)} connections:", message=the_message)
+
+
+    def reset_connections(self):
+        # Reset previously selected universes to their original colors
+        for universe in self.selected_universes:
+            self.canvas.itemconfig(self.universe_objects[universe.n][universe.a], fill=self.original_colors[(universe.n, universe.a)])
+
+        # Clear selection tracking
+        self.selected_universes.clear()
+        self.original_colors.clear()
+
+    def get_universe_on_entry(self):
+        try:
+            a = int(self.universe_a_entry.get())
+            n = int(self.universe_zn_entry.get())
+            universe = My_Zn_verse.lookup(a, n)  # None unless something still holds [a]ℤn
+
+            if universe is None or universe not in self.multiverse.graph:
+                messagebox.showerror(title="Error", message=f"Universe [{a}]ℤ{n} does not exist in Multiverse.")
+                return
+
+            # Get all related universes
+            self.find_universe_connections(universe)
+
+        except ValueError:
+            messagebox.showerror(title="Value Error", message="Please enter valid integer values for a and n.")
+
+
+    def add_universe(self):
+        try:
+            n = int(self.orbit_entry.get())
+            a = int(self.universe_entry.get())
+
+            if not (0 <= a < n and n > 1):
+                messagebox.showerror(
+                    title="Entry Error", 
+                    message="Value for orbit should be greater than 1.\nValue for planet should range from 0 to n-1."
+                )
+                return
+
+            universe = My_Zn_verse(a, n)
+
+            if universe in self.multiverse.graph:
+                messagebox.showerror(
+                    title="Entry Error", 
+                    message=f"Universe {repr(universe)} already exists."
+                )
+                return  
+
+            # Add the universe to My_Multiverse (updates the affected connections)
+            self.multiverse.add_universe(a, n)
+            
+            # Draw the universe
+            self.draw_universe(a, n)
+
+            self.multiverse.display_multiverse()
+
+        except ValueError:
+            messagebox.showerror(title="Value Error", message="Inserted value type is not allowed.\nAn integer is expected.")
+
+    def remove_universe(self):
+        try:
+            n = int(self.orbit_entry.get())
+            a = int(self.universe_entry.get())
+            universe = My_Zn_verse.lookup(a, n)
+
+            # Ensure the universe exists
+            if universe is not None and universe in self.multiverse.graph:
+                if n in self.universe_objects and a in self.universe_objects[n]:
+                    self.canvas.delete(self.universe_objects[n].pop(a))
+
+                if n in self.labels and a in self.labels[n]:
+                    self.canvas.delete(self.labels[n].pop(a))
+
+                # Remove the universe from My_Multiverse (updates the affected connections)
+                self.multiverse.remove_universe(a, n)
+                self.multiverse.display_multiverse()
+
+            else:
+                messagebox.showerror(title="Universe Not Found", message="The specified universe does not exist.")
+
+        except ValueError:
+            messagebox.showerror(title="Value Error", message="Inserted value is not allowed.\nAn integer is expected.")
+
+    def draw_universe(self, a, n):
+        """Draws a universe on the canvas without modifying My_Multiverse."""
+        if n not in self.base_radii:
+            self.base_radii[n] = 60 * n
+            self.base_periods[n] = max(1.0, n*5)
+            self.orbits[n] = self.canvas.create_oval(-self.base_radii[n],
+                                                    -self.base_radii[n],
+                                                    self.base_radii[n],
+                                                    self.base_radii[n],
+                                                    outline="gray", dash=(5, 2))
+            self.universe_objects[n] = My_Dict()
+            self.labels[n] = My_Dict()
+            self.start_times[n] = My_Dict()
+
+        color = ["gray", "yellow", "blue", "dark magenta"][n % 4]
+        universe = {"size": 7, "color": color}
+
+        if n % 2 == 1:
+            initial_angle = (a * 2 * math.pi) / n  
+            self.start_times[n][a] = self.start_time - (initial_angle * self.base_periods[n]) / (2 * math.pi)
+        else:
+            initial_angle = math.pi / n  
+            self.start_times[n][a] = self.start_time - (initial_angle * self.base_periods[n])
+
+        x = 400 + self.base_radii[n] * math.cos(initial_angle)
+        y = 300 + self.base_radii[n] * math.sin(initial_angle)
+
+        universe_obj = self.canvas.create_oval(x - 40, y - 40, x + 40, y + 40, fill=universe["color"], outline=universe["color"])
+        self.universe_objects[n][a] = universe_obj
+
+        label = self.canvas.create_text(x + 10, y - 10, text=f"[{a}]ℤ{n}", fill="white", font=("Arial", 9))
+        self.labels[n][a] = label
+
+    def remove_orbit(self):
+        try:
+            n = int(self.orbit_entry.get())
+
+            for a in self.multiverse.orbits.get(n, My_Dict()):
+                self.canvas.delete(self.universe_objects[n].pop(a))
+                self.canvas.delete(self.labels[n].pop(a))
+            self.multiverse.remove_orbit(n)
+
+            self.canvas.delete(self.orbits.pop(n))
+            self.base_radii.pop(n)
+            self.base_periods.pop(n)
+            self.universe_objects.pop(n)
+            self.labels.pop(n)
+        except ValueError:
+            messagebox.showerror(title="Value Error", message="Inserted value is not allowed.\nAn integer is expected.")
+
+    def update_universes(self):
+        current_time = time.time()
+        self.last_update_time = current_time
+
+        for n in self.base_radii:
+            scaled_radius = self.scale_factor * self.base_radii[n]
+
+            for a in self.start_times.get(n, {}):
+                elapsed_time = current_time - self.start_times[n][a]
+                angle = (2 * math.pi * elapsed_time) / self.base_periods[n] + (a * 2 * math.pi / n)
+
+                x = 400 + scaled_radius * math.cos(angle)
+                y = 300 + scaled_radius * math.sin(angle)
+                size = self.scale_factor * 7
+
+                if n in self.universe_objects and a in self.universe_objects[n]:
+                    self.canvas.coords(self.universe_objects[n][a], x - size, y - size, x + size, y + size)
+
+                if n in self.labels and a in self.labels[n]:
+                    self.canvas.coords(self.labels[n][a], x + 10, y - 10)
+
+                if n in self.orbits:
+                    self.canvas.coords(self.orbits[n], 400 - scaled_radius, 300 - scaled_radius, 
+                                    400 + scaled_radius, 300 + scaled_radius)
+
+        self.root.after(30, self.update_universes)
+        
+    def start_pan(self, event):
+        self.canvas.scan_mark(event.x, event.y)
+        
+    def pan(self, event):
+        self.canvas.scan_dragto(event.x, event.y, gain=1)
+        
+    def zoom(self, event):
+        factor = 1.1 if event.delta > 0 else 0.9
+        self.scale_factor *= factor
+
+    def on_close(self):
+        if self.snapshot_path is not None:
+            result = messagebox.askokcancel('Confirm', f'Ready to go?\nChanges will be saved to {self.snapshot_path}.')
+            if result:
+                self.multiverse.save(self.snapshot_path)
+        else:
+            result = messagebox.askokcancel('Confirm', 'Ready to go?\nUnsaved changes will be deleted.')
+        if result:
+            self.root.destroy()
+
+    def run(self):
+        self.root.mainloop()
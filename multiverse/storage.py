@@ -0,0 +1,384 @@
+"""On-disk formats: memory-mapped multiverse snapshots and the mutation log."""
+
+import mmap
+import os
+import struct
+from array import array
+
+from .structures import My_Dict, My_List, My_Set
+from .universe import My_Zn_verse
+
+def _fsync_directory(path):
+    """Makes a rename into the directory of path durable (a no-op where directories cannot be opened)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    descriptor = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+class My_Multiverse_File:
+    """Read-only view of a multiverse saved with My_Multiverse.save(), opened through mmap.
+
+    Queries work on integer ids and read the mapped file directly, so opening is
+    O(1) and no My_Zn_verse or adjacency objects are created. The layout, in
+    native byte order with every section 8-byte aligned, is:
+
+        header      magic, byte-order mark, version, vertex count V, edge count E, max_connections,
+                    generation (of the My_Mutation_Log the snapshot was compacted from; 0 otherwise)
+        universes   V (a, n) int64 pairs, in arrival order (ids are positions)
+        order       V int32 ids sorted by (n, a), for id lookups by binary search
+        offsets     V + 1 int64: the out-neighbors of id i are targets[offsets[i]:offsets[i + 1]]
+        in_offsets  V + 1 int64: the predecessors of id i are sources[in_offsets[i]:in_offsets[i + 1]]
+        targets     E int32
+        sources     E int32"""
+
+    MAGIC = b"ZNVERSE\0"
+    VERSION = 1
+    _BYTE_ORDER_MARK = 0x01020304
+    _HEADER = struct.Struct("=8sIIqqqq")
+
+    def __init__(self, path):
+        self._moduli = None  # Distinct moduli, built by the first moduli() call
+        self.file = open(path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # An empty file cannot be mapped
+            self.file.close()
+            raise ValueError(f"{path} is not a multiverse file")
+        try:
+            self._parse(path)
+        except ValueError:
+            self.close()
+            raise
+
+    def _parse(self, path):
+        if len(self.map) < self._HEADER.size:
+            raise ValueError(f"{path} is not a multiverse file")
+        magic, mark, version, count, edges, self.max_connections, self.generation = self._HEADER.unpack_from(self.map)
+        if magic != self.MAGIC:
+            raise ValueError(f"{path} is not a multiverse file")
+        if mark != self._BYTE_ORDER_MARK:
+            raise ValueError(f"{path} was written on a machine with a different byte order")
+        if version != self.VERSION:
+            raise ValueError(f"Unsupported multiverse file version {version}")
+
+        view = memoryview(self.map)
+        position = self._HEADER.size
+        sections = My_List()
+        for length, fmt in ((2 * count, "q"), (count, "i"), (count + 1, "q"), (count + 1, "q"),
+                            (edges, "i"), (edges, "i")):
+            end = position + length * struct.calcsize(fmt)
+            if end > len(self.map):
+                raise ValueError(f"{path} is truncated")
+            sections.append(view[position:end].cast(fmt))
+            position = self._align(end)
+        self.universes, self.order, self.offsets, self.in_offsets, self.targets, self.sources = sections
+
+    @staticmethod
+    def _align(position):
+        return (position + 7) & ~7
+
+    @classmethod
+    def write(cls, path, csr, max_connections, generation=0, durable=False):
+        """Writes a My_CSR_Graph whose vertices are universes to path; durable fsyncs it before returning."""
+        count = csr.vertex_count()
+        universes = array("q")
+        for universe in csr.vertices:
+            universes.append(universe.a)
+            universes.append(universe.n)
+        order = array("i", sorted(range(count), key=lambda i: (universes[2 * i + 1], universes[2 * i])))
+
+        with open(path, "wb") as file:
+            file.write(cls._HEADER.pack(cls.MAGIC, cls._BYTE_ORDER_MARK, cls.VERSION, count, csr.edge_count(),
+                                        max_connections, generation))
+            for section in (universes, order, csr.offsets, csr.in_offsets, csr.targets, csr.sources):
+                data = bytes(section) if not isinstance(section, array) else section.tobytes()
+                file.write(data)
+                file.write(bytes(cls._align(len(data)) - len(data)))
+            if durable:
+                file.flush()
+                os.fsync(file.fileno())
+
+    def close(self):
+        """Unmaps and closes the file."""
+        for name in ("universes", "order", "offsets", "in_offsets", "targets", "sources"):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+                setattr(self, name, None)
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def vertex_count(self):
+        """Returns the number of universes."""
+        return len(self.order)
+
+    def edge_count(self):
+        """Returns the number of connections."""
+        return len(self.targets)
+
+    def universe(self, vertex_id):
+        """Returns the (a, n) pair of a universe id."""
+        return self.universes[2 * vertex_id], self.universes[2 * vertex_id + 1]
+
+    def id_of(self, a, n):
+        """Returns the id of the universe [a]ℤn by binary search, raising KeyError if absent."""
+        low, high = 0, len(self.order)
+        while low < high:
+            middle = (low + high) // 2
+            candidate = self.order[middle]
+            if (self.universes[2 * candidate + 1], self.universes[2 * candidate]) < (n, a):
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self.order):
+            candidate = self.order[low]
+            if self.universe(candidate) == (a, n):
+                return candidate
+        raise KeyError(f"Universe [{a}]ℤ{n} not found")
+
+    def moduli(self):
+        """Returns an array('q') of the distinct moduli in increasing order (computed once)."""
+        if self._moduli is None:
+            self._moduli = array("q")
+            for vertex_id in self.order:
+                n = self.universes[2 * vertex_id + 1]
+                if len(self._moduli) == 0 or self._moduli[-1] != n:
+                    self._moduli.append(n)
+        return self._moduli
+
+    def locate(self, k):
+        """Returns a My_List of the ids of the universes containing k (one lookup of k % n per modulus)."""
+        found = My_List()
+        for n in self.moduli():
+            try:
+                found.append(self.id_of(k % n, n))
+            except KeyError:
+                pass
+        return found
+
+    def degree(self, vertex_id):
+        """Returns the out-degree of a universe id."""
+        return self.offsets[vertex_id + 1] - self.offsets[vertex_id]
+
+    def neighbors(self, vertex_id):
+        """Returns a list of the ids vertex_id has a connection to (a copy, so it outlives close())."""
+        return self.targets[self.offsets[vertex_id]:self.offsets[vertex_id + 1]].tolist()
+
+    def predecessors(self, vertex_id):
+        """Returns a list of the ids with a connection into vertex_id (a copy, so it outlives close())."""
+        return self.sources[self.in_offsets[vertex_id]:self.in_offsets[vertex_id + 1]].tolist()
+
+    def shortest_path(self, a1, n1, a2, n2):
+        """Returns a My_List of (a, n) pairs on a shortest chain of transitions, or None."""
+        source, target = self.id_of(a1, n1), self.id_of(a2, n2)
+        previous = array("i", [-1]) * self.vertex_count()  # -1: not reached yet
+        previous[source] = source
+        frontier = array("i", [source])
+        while len(frontier) > 0 and previous[target] < 0:
+            next_frontier = array("i")
+            for vertex_id in frontier:
+                for neighbor in self.neighbors(vertex_id):
+                    if previous[neighbor] < 0:
+                        previous[neighbor] = vertex_id
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        if previous[target] < 0:
+            return None
+
+        path = My_List()
+        vertex_id = target
+        while vertex_id != source:
+            path.insert(0, self.universe(vertex_id))
+            vertex_id = previous[vertex_id]
+        path.insert(0, self.universe(source))
+        return path
+
+    def reachable(self, a1, n1, a2, n2):
+        """Checks whether [a2]ℤn2 can be reached from [a1]ℤn1."""
+        return self.shortest_path(a1, n1, a2, n2) is not None
+
+class My_Mutation_Log:
+    """Append-only, line-oriented log of the changes made to a My_Multiverse.
+
+    Each line is one event: "add a n", "remove a n" or "remove_orbit n". Events
+    are written before the change is applied (write-ahead). Every compact_every
+    events the multiverse is saved to snapshot_path and the log is truncated, so
+    recovery only replays the changes made since the last snapshot.
+
+    Each compaction starts a new generation: the snapshot records it in its
+    header and the truncated log starts with a "generation g" line, so recovery
+    can tell whether the log's events are already in the snapshot."""
+
+    OPERATIONS = {"add": 2, "remove": 2, "remove_orbit": 1}  # Operation -> number of integer arguments
+
+    def __init__(self, path, snapshot_path=None, compact_every=None, durable=False):
+        self.path = path
+        self.snapshot_path = snapshot_path
+        self.compact_every = compact_every  # None: never compact automatically
+        self.durable = durable  # fsync after every event
+        self.pending = 0  # Events written since the last compaction
+        self._drop_torn_tail()
+        self.generation = self._read_generation()  # Compactions so far; 0 for a log never compacted
+        self.file = open(path, "a", encoding="utf-8")
+
+    def _drop_torn_tail(self):
+        """Truncates the log after its last newline, so a write cut short by a crash is not appended to."""
+        try:
+            file = open(self.path, "r+b")
+        except FileNotFoundError:
+            return
+        with file:
+            end = position = file.seek(0, os.SEEK_END)
+            while position > 0:
+                start = max(0, position - 4096)
+                file.seek(start)
+                newline = file.read(position - start).rfind(b"\n")
+                if newline >= 0:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < end:
+                file.truncate(position)
+                if self.durable:
+                    os.fsync(file.fileno())
+
+    def _read_generation(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                fields = file.readline().split()
+        except FileNotFoundError:
+            return 0
+        if len(fields) == 2 and fields[0] == "generation" and fields[1].isdigit():
+            return int(fields[1])
+        return 0
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def is_empty(self):
+        """Checks whether the log holds no events."""
+        return next(self.events(), None) is None
+
+    def has_snapshot(self):
+        """Checks whether a snapshot to replay on top of exists."""
+        return self.snapshot_path is not None and os.path.exists(self.snapshot_path)
+
+    def append(self, operation, *args):
+        """Writes one event to the end of the log."""
+        self.file.write(" ".join((operation,) + tuple(str(arg) for arg in args)) + "\n")
+        self.file.flush()
+        if self.durable:
+            os.fsync(self.file.fileno())
+        self.pending += 1
+
+    def changed(self, multiverse):
+        """Called after multiverse applied a change; compacts once compact_every events piled up."""
+        if self.compact_every is not None and self.pending >= self.compact_every:
+            self.compact(multiverse)
+
+    def compact(self, multiverse):
+        """Atomically replaces the snapshot with multiverse as the next generation and empties the log."""
+        if self.snapshot_path is None:
+            raise ValueError("Compaction needs a snapshot path.")
+        partial = self.snapshot_path + ".tmp"
+        multiverse.save(partial, generation=self.generation + 1, durable=self.durable)
+        os.replace(partial, self.snapshot_path)
+        if self.durable:
+            _fsync_directory(self.snapshot_path)
+        self._restart(self.generation + 1)
+
+    def _restart(self, generation):
+        """Empties the log and starts it at generation."""
+        self.file.truncate(0)
+        self.file.write(f"generation {generation}\n")
+        self.file.flush()
+        if self.durable:
+            os.fsync(self.file.fileno())
+        self.generation = generation
+        self.pending = 0
+
+    def events(self):
+        """Yields every (operation, args) event in the log, skipping the generation line and a torn last line."""
+        self.file.flush()
+        with open(self.path, "r", encoding="utf-8") as file:
+            for number, line in enumerate(file, 1):
+                if not line.endswith("\n"):
+                    return
+                fields = line.split()
+                if len(fields) == 0:
+                    continue
+                operation = fields[0]
+                if operation == "generation" and number == 1:
+                    continue
+                if self.OPERATIONS.get(operation) != len(fields) - 1:
+                    raise ValueError(f"{self.path}:{number}: malformed event {line.strip()!r}")
+                try:
+                    args = tuple(int(field) for field in fields[1:])
+                except ValueError:
+                    raise ValueError(f"{self.path}:{number}: malformed event {line.strip()!r}") from None
+                yield operation, args
+
+    def replay(self, multiverse, batch_size=4096, generation=None):
+        """Applies the events to multiverse in batches (the last per universe wins); returns how many were read."""
+        # generation is that of the snapshot multiverse was loaded from, if known: a newer one already
+        # holds the events (a crash between compact's save and truncate), an older one lacks changes
+        if generation is not None:
+            if generation > self.generation:
+                self._restart(generation)
+                return 0
+            if generation < self.generation:
+                raise ValueError(f"{self.path} continues generation {self.generation}, "
+                                 f"but the snapshot is generation {generation}")
+        log, multiverse.log = multiverse.log, None
+        try:
+            count = 0
+            batch = My_Dict()  # universe -> True to add, False to remove, in the order of their last event
+            removed = My_Set()  # Universes removed at some point of the batch
+            for operation, args in self.events():
+                if operation == "remove_orbit":
+                    doomed = My_List()
+                    doomed.extend(universe for a, universe in multiverse.orbits.get(args[0], My_Dict()).items())
+                    doomed.extend(universe for universe in batch if universe.n == args[0] and batch[universe])
+                    for universe in doomed:
+                        self._batch_event(batch, removed, universe, False)
+                else:
+                    self._batch_event(batch, removed, My_Zn_verse(*args), operation == "add")
+                count += 1
+                if count % batch_size == 0:
+                    self._apply_batch(multiverse, batch, removed)
+                    batch, removed = My_Dict(), My_Set()
+            self._apply_batch(multiverse, batch, removed)
+            self.pending = count
+            return count
+        finally:
+            multiverse.log = log
+
+    @staticmethod
+    def _batch_event(batch, removed, universe, add):
+        if universe in batch:
+            del batch[universe]  # Move to the end: arrival order follows the last event
+        batch[universe] = add
+        if not add:
+            removed.add(universe)
+
+    @staticmethod
+    def _apply_batch(multiverse, batch, removed):
+        # An add after a remove of a present universe re-adds it as a new arrival, as it did live
+        multiverse.remove_universes((universe.a, universe.n) for universe in batch
+                                    if not batch[universe] or universe in removed)
+        multiverse.add_universes((universe.a, universe.n) for universe in batch if batch[universe])
@@ -0,0 +1,570 @@
+"""Array, hash-table and set containers built on ctypes, used by every other module."""
+
+import copy
+import ctypes
+
+# My_List's ctypes array holds borrowed pointers (ctypes does not keep them
+# alive per index), so whole blocks of them can be moved with ctypes.memmove.
+# The references are owned by a Python list kept in the same order, which the
+# garbage collector can traverse, so cycles through a My_List are collected.
+_PTR_SIZE = ctypes.sizeof(ctypes.c_void_p)
+
+class My_List:
+    _MIN_CAPACITY = 4  # pop() never shrinks the array below this
+
+    def __init__(self):
+        self.size = 0  # Number of elements in the list
+        self.capacity = 1  # Default capacity
+        self.reserved = 0  # Capacity promised by reserve(); pop() won't shrink below it
+        self._owner = []  # Owns the references to the elements, in array order
+        self._set_array(self._make_array(self.capacity))
+    
+    def _make_array(self, capacity):
+        """Creates a new array with the given capacity using ctypes."""
+        return (capacity * ctypes.py_object)()
+
+    def _set_array(self, array):
+        """Installs array as the backing store."""
+        self.array = array
+
+    def _write_slot(self, index, address):
+        """Writes a raw object address (None for an empty slot) without touching refcounts."""
+        ctypes.c_void_p.from_address(ctypes.addressof(self.array) + index * _PTR_SIZE).value = address
+
+    def _move(self, dest, src, count):
+        """Moves count pointers from slot src to slot dest in one memmove."""
+        base = ctypes.addressof(self.array)
+        ctypes.memmove(base + dest * _PTR_SIZE, base + src * _PTR_SIZE, count * _PTR_SIZE)
+
+    def append(self, item):
+        """Adds an element to the end of the list, resizing if necessary."""
+        if self.size == self.capacity:
+            self._resize(2 * self.capacity)  # Double capacity
+        
+        self._owner.append(item)
+        self._write_slot(self.size, id(item))
+        self.size += 1
+
+    def extend(self, iterable):
+        """Appends every element of iterable, growing the array at most once."""
+        items = list(iterable)
+
+        new_size = self.size + len(items)
+        if new_size > self.capacity:
+            self._resize(max(new_size, 2 * self.capacity))
+
+        self._owner.extend(items)
+        for i in range(len(items)):
+            self._write_slot(self.size + i, id(items[i]))
+        self.size = new_size
+    
+    def insert(self, index, item):
+        """Inserts an element at the specified index, shifting elements if needed."""
+        if not 0 <= index <= self.size:
+            raise IndexError("Index out of range")
+        
+        if self.size == self.capacity:
+            self._resize(2 * self.capacity)
+        
+        self._move(index + 1, index, self.size - index)  # Shift elements right
+        self._owner.insert(index, item)
+        self._write_slot(index, id(item))
+        self.size += 1
+
+    def remove(self, value):
+        """Removes the first occurrence of the specified value."""
+        for i in range(self.size):
+            if self.array[i] == value:
+                self.pop(i)
+                return
+        raise ValueError("Value not found in list")
+    
+    def pop(self, index=None):
+        """Removes and returns an item at a given index (or the last item by default)."""
+        if self.size == 0:
+            raise IndexError("Pop from empty list")
+
+        if index is None:
+            index = self.size - 1  # Default to last element
+        
+        if index < 0:  
+            index += self.size  # Convert negative index to positive
+        
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+
+        item = self._owner.pop(index)
+
+        self._move(index, index + 1, self.size - index - 1)  # Shift elements left
+        self._write_slot(self.size - 1, None)  # Slot is empty again
+        self.size -= 1
+
+        # Shrink only once a quarter full, and only by half, so alternating
+        # append/pop around the boundary never triggers back-to-back resizes
+        if self.size <= self.capacity // 4 and self.capacity // 2 >= max(self._MIN_CAPACITY, self.reserved):
+            self._resize(self.capacity // 2)
+
+        return item
+    
+    def clear(self):
+        """Removes all elements from the list."""
+        self.size = 0
+        self.capacity = max(1, self.reserved)
+        self._set_array(self._make_array(self.capacity))
+        self._owner.clear()
+
+    def reserve(self, capacity):
+        """Ensures room for at least capacity elements without further resizing."""
+        self.reserved = capacity
+        if capacity > self.capacity:
+            self._resize(capacity)
+
+    def shrink_to_fit(self):
+        """Releases unused capacity and drops any reservation."""
+        self.reserved = 0
+        if self.capacity > max(1, self.size):
+            self._resize(max(1, self.size))
+
+    def _resize(self, new_capacity):
+        """Resizes internal array to a new capacity."""
+        new_array = self._make_array(new_capacity)
+        ctypes.memmove(new_array, self.array, self.size * _PTR_SIZE)  # Borrowed pointers, no refcounts
+        
+        self._set_array(new_array)
+        self.capacity = new_capacity
+    
+    def __len__(self):
+        """Returns the number of elements in the list."""
+        return self.size
+    
+    def __getitem__(self, index):
+        """Retrieves an item at a given index, or a new My_List for a slice."""
+        if isinstance(index, slice):
+            sliced = My_List()
+            sliced.extend(self.view(index.start, index.stop, index.step))
+            return sliced
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+        return self.array[index]
+
+    def __iter__(self):
+        """Returns an iterator that walks the backing array directly."""
+        return My_List_Iterator(self, 0, 1)
+
+    def view(self, start=None, stop=None, step=None):
+        """Returns a read-only My_List_View over part of the list without copying it."""
+        start, stop, step = slice(start, stop, step).indices(self.size)
+        return My_List_View(self, start, len(range(start, stop, step)), step)
+    
+    def __setitem__(self, index, value):
+        """Sets an item at a given index."""
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+        self._write_slot(index, id(value))
+        self._owner[index] = value  # Releases the old element last
+
+    def __copy__(self):
+        """Returns a new My_List holding its own references to the same elements."""
+        copied = My_List()
+        copied.extend(self)
+        return copied
+
+    def __deepcopy__(self, memo):
+        copied = My_List()
+        memo[id(self)] = copied
+        copied.extend(copy.deepcopy(item, memo) for item in self)
+        return copied
+    
+    def __repr__(self):
+        """String representation of the list."""
+        return f"([{', '.join(repr(self.array[i]) for i in range(self.size))}])"
+
+class My_List_Iterator:
+    """Iterator over a My_List (or a view of one) that reads the ctypes array directly."""
+
+    def __init__(self, source, start, step, length=None):
+        self.source = source
+        self.index = start
+        self.step = step
+        self.remaining = length  # None: run until the end of the list
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.remaining is not None:
+            if self.remaining == 0:
+                raise StopIteration
+            self.remaining -= 1
+        if not 0 <= self.index < self.source.size:  # The list may have shrunk meanwhile
+            raise StopIteration
+        item = self.source.array[self.index]
+        self.index += self.step
+        return item
+
+class My_List_View:
+    """Read-only window (start, length, step) over a My_List's backing array.
+
+    A view does not copy anything, so it reflects later changes to the list."""
+
+    def __init__(self, source, start, length, step):
+        self.source = source
+        self.start = start
+        self.length = length
+        self.step = step
+
+    def __len__(self):
+        """Returns the number of elements in the view."""
+        return self.length
+
+    def __getitem__(self, index):
+        """Retrieves an item of the view, or a narrower view for a slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            return My_List_View(self.source, self.start + start * self.step,
+                                len(range(start, stop, step)), self.step * step)
+        if not 0 <= index < self.length:
+            raise IndexError("Index out of range")
+        return self.source[self.start + index * self.step]
+
+    def __iter__(self):
+        return My_List_Iterator(self.source, self.start, self.step, self.length)
+
+    def __repr__(self):
+        """String representation of the view, matching My_List."""
+        return f"([{', '.join(repr(item) for item in self)}])"
+
+class My_Dict:
+    _EMPTY = -1  # Index slot that has never held an entry
+    _DUMMY = -2  # Index slot whose entry was deleted (tombstone)
+    _MIN_SIZE = 8  # Smallest index table size, always a power of two
+    _PERTURB_SHIFT = 5
+    _DELETED = object()  # Placeholder left in the entry lists by deletions
+
+    def __init__(self):
+        # Entries are stored densely in insertion order; the index table maps
+        # hash slots to positions in these lists (open addressing).
+        self._entry_keys = My_List()
+        self._entry_values = My_List()
+        self._entry_hashes = My_List()
+        self._used = 0  # Number of live key-value pairs
+        self._index_size = self._MIN_SIZE
+        self._index = self._make_index(self._index_size)
+
+    def _make_index(self, size):
+        """Creates an index table of the given size with every slot set to _EMPTY."""
+        index = (size * ctypes.c_ssize_t)()
+        ctypes.memset(index, 0xFF, ctypes.sizeof(index))  # All bits set == -1 == _EMPTY
+        return index
+
+    def _usable(self):
+        """Returns how many entries fit before the table must be rebuilt (load factor 2/3)."""
+        return (self._index_size * 2) // 3
+
+    def _lookup(self, key, key_hash):
+        """Returns (slot, entry) for key, or (-1, -1) if the key is not present."""
+        index = self._index
+        keys = self._entry_keys.array
+        hashes = self._entry_hashes.array
+        mask = self._index_size - 1
+        perturb = key_hash & 0xFFFFFFFFFFFFFFFF  # Treat the hash as unsigned
+        slot = key_hash & mask
+
+        while True:
+            entry = index[slot]
+            if entry == self._EMPTY:
+                return -1, -1
+            if entry >= 0:
+                existing = keys[entry]
+                if existing is key or (hashes[entry] == key_hash and existing == key):
+                    return slot, entry
+            perturb >>= self._PERTURB_SHIFT
+            slot = (5 * slot + perturb + 1) & mask
+
+    def _find_empty_slot(self, index, mask, key_hash):
+        """Returns the first never-used slot on the probe sequence of key_hash."""
+        perturb = key_hash & 0xFFFFFFFFFFFFFFFF
+        slot = key_hash & mask
+        while index[slot] != self._EMPTY:
+            perturb >>= self._PERTURB_SHIFT
+            slot = (5 * slot + perturb + 1) & mask
+        return slot
+
+    def _rebuild(self, min_size):
+        """Compacts the entries and rehashes them into an index of at least min_size slots."""
+        size = self._MIN_SIZE
+        while size < min_size:
+            size <<= 1
+
+        keys = My_List()
+        values = My_List()
+        hashes = My_List()
+        for entries in (keys, values, hashes):
+            entries.reserve((size * 2) // 3)  # Entries never outgrow the usable slots
+        index = self._make_index(size)
+        mask = size - 1
+
+        for i in range(len(self._entry_keys)):
+            key = self._entry_keys.array[i]
+            if key is self._DELETED:
+                continue
+            key_hash = self._entry_hashes.array[i]
+            index[self._find_empty_slot(index, mask, key_hash)] = len(keys)
+            keys.append(key)
+            values.append(self._entry_values.array[i])
+            hashes.append(key_hash)
+
+        self._entry_keys = keys
+        self._entry_values = values
+        self._entry_hashes = hashes
+        self._index = index
+        self._index_size = size
+
+    def _delete_entry(self, slot, entry):
+        """Turns the index slot into a tombstone and returns the removed value."""
+        value = self._entry_values.array[entry]
+        self._index[slot] = self._DUMMY
+        self._entry_keys[entry] = self._DELETED
+        self._entry_values[entry] = None  # Avoid memory leak
+        self._used -= 1
+
+        # Shrink once the table is mostly empty
+        if self._index_size > self._MIN_SIZE and self._used * 8 <= self._index_size:
+            self._rebuild(3 * self._used)
+        return value
+
+    def reserve(self, count):
+        """Makes room for count key-value pairs in total without another rebuild."""
+        if count > self._usable():
+            self._rebuild((3 * count) // 2 + 1)
+
+    def __setitem__(self, key, value):
+        """Sets or updates a key-value pair in the dictionary."""
+        key_hash = hash(key)
+        slot, entry = self._lookup(key, key_hash)
+        if entry >= 0:
+            self._entry_values[entry] = value
+            return
+
+        if len(self._entry_keys) >= self._usable():
+            self._rebuild(3 * self._used)  # Grow (or just drop tombstones)
+
+        slot = self._find_empty_slot(self._index, self._index_size - 1, key_hash)
+        self._index[slot] = len(self._entry_keys)
+        self._entry_keys.append(key)
+        self._entry_values.append(value)
+        self._entry_hashes.append(key_hash)
+        self._used += 1
+    
+    def __getitem__(self, key):
+        """Retrieves the value associated with a given key."""
+        slot, entry = self._lookup(key, hash(key))
+        if entry < 0:
+            raise KeyError("Key not found")
+        return self._entry_values.array[entry]
+    
+    def __delitem__(self, key):
+        """Removes a key-value pair from the dictionary."""
+        slot, entry = self._lookup(key, hash(key))
+        if entry < 0:
+            raise KeyError("Key not found")
+        self._delete_entry(slot, entry)
+
+    def __contains__(self, key):
+        """Checks if a key exists in the dictionary."""
+        return self._lookup(key, hash(key))[1] >= 0
+    
+    def __iter__(self):
+        """Iterates over keys in the dictionary in insertion order."""
+        keys = self._entry_keys
+        for i in range(len(keys)):
+            key = keys.array[i]
+            if key is not self._DELETED:
+                yield key
+
+    def __len__(self):
+        """Returns the number of key-value pairs."""
+        return self._used
+
+    def get(self, key, default=None):
+        """Retrieves a value for a key, or returns default if the key does not exist."""
+        slot, entry = self._lookup(key, hash(key))
+        if entry < 0:
+            return default
+        return self._entry_values.array[entry]
+    
+    def keys(self):
+        """Returns a My_List containing all keys."""
+        keys_list = My_List()
+        for key in self:
+            keys_list.append(key)
+        return keys_list
+
+    def values(self):
+        """Returns a My_List containing all unique values."""
+        values_list = My_List()
+        for key, value in self.items():
+            # Manually check if value already exists in values_list
+            is_unique = True
+            for existing_value in values_list:
+                if existing_value == value:
+                    is_unique = False
+                    break
+            if is_unique:
+                values_list.append(value)
+        return values_list
+
+    def items(self):
+        """Returns an iterator of (key, value) pairs."""
+        keys = self._entry_keys
+        for i in range(len(keys)):
+            key = keys.array[i]
+            if key is not self._DELETED:
+                yield (key, self._entry_values.array[i])
+
+    def pop(self, key, default=None):
+        """Removes the specified key and returns its value. 
+        If the key does not exist, return default (or raise KeyError if no default is provided)."""
+        slot, entry = self._lookup(key, hash(key))
+        if entry >= 0:
+            return self._delete_entry(slot, entry)
+        if default is not None:
+            return default
+        raise KeyError(f"Key {key} not found")
+
+    def __repr__(self):
+        """String representation of the dictionary."""
+        return f"{{{', '.join(f'{repr(key)}: {repr(value)}' for key, value in self.items())}}}"
+
+class My_Set:
+    """Insertion-ordered set: O(1) add, discard and membership.
+
+    Up to _SMALL items are kept in a My_List and found by a linear scan, which is
+    as fast at that size and far smaller than a hash table; a larger set moves
+    to a My_Dict (item -> True). Adjacency rows are mostly this small."""
+
+    _SMALL = 8
+
+    def __init__(self, iterable=()):
+        self.items = My_List()  # My_Dict once the set outgrows _SMALL
+        for item in iterable:
+            self.add(item)
+
+    def _small(self):
+        """Returns the elements as a Python list while the set is small, otherwise None."""
+        items = self.items
+        return items.array[:items.size] if isinstance(items, My_List) else None
+
+    def add(self, item):
+        """Adds item if it is not already present; returns True if it was added."""
+        small = self._small()
+        if small is None:
+            if item in self.items:
+                return False
+            self.items[item] = True
+            return True
+
+        if item in small:
+            return False
+        if len(small) < self._SMALL:
+            self.items.append(item)
+            return True
+        items = My_Dict()
+        items.reserve(2 * self._SMALL)
+        for existing in small:
+            items[existing] = True
+        items[item] = True
+        self.items = items
+        return True
+
+    def discard(self, item):
+        """Removes item if present; returns True if it was removed."""
+        small = self._small()
+        if small is None:
+            return self.items.pop(item, False)
+        for i in range(len(small)):
+            if small[i] == item:
+                self.items.pop(i)
+                return True
+        return False
+
+    def remove(self, item):
+        """Removes item, raising ValueError if it is not present."""
+        if not self.discard(item):
+            raise ValueError("Value not found in set")
+
+    def __contains__(self, item):
+        """Checks if item is in the set."""
+        small = self._small()
+        return item in self.items if small is None else item in small
+
+    def __len__(self):
+        """Returns the number of elements in the set."""
+        return len(self.items)
+
+    def __iter__(self):
+        """Iterates over the elements in insertion order."""
+        return iter(self.items)
+
+    def view(self):
+        """Returns a read-only My_Set_View of the set."""
+        return My_Set_View(self)
+
+    def __repr__(self):
+        """String representation of the set, matching My_List."""
+        return f"([{', '.join(repr(item) for item in self)}])"
+
+class My_Set_View:
+    """Read-only window onto a My_Set; it reflects later changes to the set."""
+
+    def __init__(self, source):
+        self.source = source
+
+    def __contains__(self, item):
+        return item in self.source
+
+    def __len__(self):
+        return len(self.source)
+
+    def __iter__(self):
+        return iter(self.source)
+
+    def __repr__(self):
+        return repr(self.source)
+
+class My_LRU_Cache:
+    """Bounded mapping that evicts the least recently used entry.
+
+    Recency is kept by My_Dict's insertion order: a hit moves the key to the end."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.entries = My_Dict()
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        """Returns the cached value for key (marking it most recent), or default."""
+        if key not in self.entries:
+            return default
+        value = self.entries.pop(key)
+        self.entries[key] = value
+        return value
+
+    def put(self, key, value):
+        """Stores value under key, evicting the least recently used entry if full."""
+        if self.capacity <= 0:
+            return
+        if key in self.entries:
+            self.entries.pop(key)
+        elif len(self.entries) >= self.capacity:
+            self.entries.pop(next(iter(self.entries)))
+        self.entries[key] = value
+
+    def clear(self):
+        """Removes every entry."""
+        self.entries = My_Dict()
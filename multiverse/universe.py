@@ -0,0 +1,618 @@
+"""Universes [a]ℤn, the divisibility lattice of their moduli and lazy set algebra over them."""
+
+import heapq
+import math
+import weakref
+
+from .structures import My_Dict, My_List, My_Set
+
+_np = None  # NumPy module once _numpy() has tried to import it
+_np_loaded = False
+
+
+def _numpy():
+    """Returns NumPy, imported on first use so importing the package stays cheap, or None when
+    it is not installed (the vectorized helpers then fall back to plain Python)."""
+    global _np, _np_loaded
+    if not _np_loaded:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+        _np_loaded = True
+    return _np
+
+
+def _as_array(np, values):
+    """Converts values to a NumPy array without coercing mixed input: when Python ints
+    would not stay integers (say next to a float), the elements are kept as objects."""
+    if isinstance(values, np.ndarray):
+        return values
+    if not hasattr(values, "__len__"):  # An iterator, which NumPy would wrap as one object
+        values = list(values)
+    array = np.asarray(values)
+    if array.dtype.kind not in "iuO":
+        array = np.asarray(values, dtype=object)
+    return array
+
+
+def _crt(a1, n1, a2, n2):
+    """Returns (a, lcm) such that [a]ℤlcm holds the integers in both [a1]ℤn1 and [a2]ℤn2,
+    or None if there are none (Chinese Remainder Theorem)."""
+    g = math.gcd(n1, n2)
+    if (a2 - a1) % g != 0:
+        return None
+    step = n2 // g
+    t = (a2 - a1) // g * pow(n1 // g, -1, step) % step
+    return (a1 + n1 * t) % (n1 * step), n1 * step
+
+_FLIP = bytes.maketrans(b"\x00\x01", b"\x01\x00")  # Complements a residue mask
+
+
+def _residues(mask):
+    """Returns the residues r with mask[r] set, in increasing order."""
+    return [r for r, member in enumerate(mask) if member]
+
+
+def _avoiders(lower, upper, classes, limit):
+    """Counts the integers in [lower, upper] in none of the (r, m) classes, sorted largest m first."""
+    count = 0
+    for i in range(len(classes) + 1):
+        rest = classes[i:]
+        length = upper - lower + 1
+        if len(rest) == 0:
+            return count + length
+        if length <= limit:  # Narrow range: sieve it directly
+            window = bytearray(length)
+            for r, m in rest:
+                first = (r - lower) % m
+                if first < length:
+                    window[first::m] = b"\x01" * len(range(first, length, m))
+            return count + window.count(0)
+        period = 1
+        for r, m in rest:
+            period = math.lcm(period, m)
+            if period > limit:
+                break
+        if period <= limit:  # Short period: sieve one period
+            mask = bytearray(period)
+            for r, m in rest:
+                mask[r::m] = b"\x01" * (period // m)
+            per_period = mask.count(0)
+            below = lambda k: (k // period) * per_period + mask.count(0, 0, k % period)
+            return count + below(upper + 1) - below(lower)
+
+        # Take out the members of class i: they are r + m * t for t in [t_lower, t_upper], and the
+        # later classes restricted to them are classes of t (or cover them all, or miss them)
+        r, m = classes[i]
+        t_lower, t_upper = -((r - lower) // m), (upper - r) // m
+        if t_lower > t_upper:
+            continue
+        restricted = set()
+        for s, q in classes[i + 1:]:
+            g = math.gcd(m, q)
+            if (s - r) % g != 0:
+                continue
+            q //= g
+            if q == 1:
+                break
+            restricted.add(((s - r) // g * pow(m // g, -1, q) % q, q))
+        else:
+            count -= _avoiders(t_lower, t_upper, sorted(restricted, key=lambda c: -c[1]), limit)
+    return count
+
+class My_Zn_verse:
+    __slots__ = ("a", "n", "_hash", "__weakref__")
+
+    # Interning table {(a, n): instance}: every live (a, n) pair maps to one shared
+    # instance. Entries are weak, so a universe nobody references drops out by itself.
+    _instances = weakref.WeakValueDictionary()
+
+    def __new__(cls, a, n):
+        universe = cls.lookup(a, n)
+        if universe is not None:
+            return universe
+
+        if n <= 1:
+            raise ValueError("n must be greater than 1.")
+        if not (0 <= a < n):
+            raise ValueError("a must be in the range 0 <= a < n.")
+        
+        universe = super().__new__(cls)
+        object.__setattr__(universe, "a", a)
+        object.__setattr__(universe, "n", n)
+        object.__setattr__(universe, "_hash", hash((a, n)))
+        cls._instances[(a, n)] = universe
+        return universe
+
+    @classmethod
+    def lookup(cls, a, n):
+        """Returns the live instance of [a]ℤn, or None if there is none (without creating one)."""
+        if not (isinstance(a, int) and isinstance(n, int)):
+            raise TypeError("Both a and n must be integers.")
+        return cls._instances.get((a, n))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("My_Zn_verse instances are immutable.")
+
+    def __reduce__(self):
+        return (My_Zn_verse, (self.a, self.n))  # Re-interned when unpickled
+    
+    def contains(self, k):
+        return isinstance(k, int) and (k - self.a) % self.n == 0
+
+    def contains_many(self, values):
+        """Tests many integers at once.
+
+        Returns a NumPy boolean mask when NumPy is available (values may be any
+        array-like), otherwise a My_List of booleans. Either way each entry matches
+        contains(): values that are not integers are not members."""
+        np = _numpy()
+        if np is not None:
+            array = _as_array(np, values)
+            if array.dtype.kind in "iu":
+                return array % self.n == self.a
+            return np.fromiter((self.contains(k) for k in array.ravel().tolist()), dtype=bool,
+                               count=array.size).reshape(array.shape)
+        mask = My_List()
+        mask.extend(self.contains(k) for k in values)
+        return mask
+    
+    def members(self, lower, upper):
+        """Returns a lazy range of the members k with lower <= k <= upper (O(1) memory)."""
+        if not (isinstance(lower, int) and isinstance(upper, int)):
+            raise TypeError("Bounds must be integers.")
+        if lower > upper:
+            raise ValueError("Lower bound must be <= upper bound.")
+        start = self.a if self.a >= lower else lower + (self.n - (lower - self.a) % self.n) % self.n
+        return range(start, upper + 1, self.n)
+
+    def generate(self, lower, upper):
+        return list(self.members(lower, upper))
+
+    def count(self, lower, upper):
+        """Returns how many members generate(lower, upper) would list, without listing them."""
+        return len(self.members(lower, upper))
+
+    def intersection(self, other):
+        """Returns the universe of integers in both self and other, or None if they are disjoint.
+
+        Solved in closed form with the Chinese Remainder Theorem."""
+        overlap = _crt(self.a, self.n, other.a, other.n)
+        return None if overlap is None else My_Zn_verse(*overlap)
+
+    def includes(self, other):
+        """Checks whether every member of the universe other is also a member of self."""
+        return other.n % self.n == 0 and other.a % self.n == self.a
+
+    def union(self, other):
+        """Returns a lazy My_Zn_Union of self and other (a universe or another expression)."""
+        return My_Zn_Union(self) | other
+
+    def difference(self, other):
+        """Returns a lazy My_Zn_Difference of the members of self that are not in other."""
+        return My_Zn_Difference(My_Zn_Union(self), other)
+
+    def __and__(self, other):
+        if isinstance(other, My_Zn_verse):
+            return self.intersection(other)
+        return NotImplemented
+
+    def __or__(self, other):
+        if isinstance(other, (My_Zn_verse, My_Zn_Union)):
+            return self.union(other)
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, (My_Zn_verse, My_Zn_Union)):
+            return self.difference(other)
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"[{self.a}]ℤ{self.n}"
+    
+    def __contains__(self, k):
+        return self.contains(k)
+    
+    def __eq__(self, other):
+        if self is other:  # Interned, so equal universes are normally the same object
+            return True
+        return isinstance(other, My_Zn_verse) and self.n == other.n and self.a == other.a
+    
+    def __hash__(self):
+        return self._hash
+
+class My_Moduli_Lattice:
+    """Divisibility lattice of a changing set of moduli.
+
+    For every modulus present it keeps the other present moduli that divide it
+    and those it divides, so related orbits are found without trial division."""
+
+    def __init__(self):
+        self.divisor_sets = My_Dict()  # n -> My_Set of present proper divisors of n
+        self.multiple_sets = My_Dict()  # n -> My_Set of present proper multiples of n
+
+    def __contains__(self, n):
+        return n in self.divisor_sets
+
+    def __len__(self):
+        return len(self.divisor_sets)
+
+    def __iter__(self):
+        return iter(self.divisor_sets)
+
+    def _link(self, d, m):
+        """Records that the present modulus d properly divides the present modulus m."""
+        self.divisor_sets[m].add(d)
+        self.multiple_sets[d].add(m)
+
+    def add_modulus(self, n):
+        """Adds n, comparing it once against every modulus already present."""
+        self.add_moduli((n,))
+
+    def add_moduli(self, moduli):
+        """Adds several moduli, linking them either pairwise or with a sieve over multiples,
+        whichever visits fewer candidates."""
+        new = My_Set(n for n in moduli if n not in self)
+        if len(new) == 0:
+            return
+        for n in new:
+            self.divisor_sets[n] = My_Set()
+            self.multiple_sets[n] = My_Set()
+
+        largest = max(self.divisor_sets)
+        sieve_cost = sum(largest // n for n in self.divisor_sets)
+        if sieve_cost <= len(new) * len(self.divisor_sets):
+            for d in self.divisor_sets:
+                for m in range(2 * d, largest + 1, d):
+                    if m in self.divisor_sets and (d in new or m in new):
+                        self._link(d, m)
+        else:
+            for n in new:
+                for other in self.divisor_sets:
+                    if other == n or (other in new and other < n):
+                        continue  # Pairs of new moduli are compared once, from the smaller side
+                    if other % n == 0:
+                        self._link(n, other)
+                    elif n % other == 0:
+                        self._link(other, n)
+
+    def remove_modulus(self, n):
+        """Removes n and every link to it."""
+        if n not in self:
+            return
+        for d in self.divisor_sets.pop(n):
+            self.multiple_sets[d].discard(n)
+        for m in self.multiple_sets.pop(n):
+            self.divisor_sets[m].discard(n)
+
+    def divisors(self, n):
+        """Returns a read-only My_Set_View of the present moduli that properly divide n."""
+        divisors = self.divisor_sets.get(n)
+        return (My_Set() if divisors is None else divisors).view()
+
+    def multiples(self, n):
+        """Returns a read-only My_Set_View of the present moduli that n properly divides."""
+        multiples = self.multiple_sets.get(n)
+        return (My_Set() if multiples is None else multiples).view()
+
+class My_Zn_Union:
+    """Lazy union of universes: nothing is enumerated until stream() is iterated.
+
+    Universes included in another term are dropped, so the terms are never redundant."""
+
+    def __init__(self, *universes):
+        self.terms = My_Set()
+        self.orbits = My_Dict()  # n -> My_Dict a -> the term [a]ℤn (kept once seen, even if emptied)
+        self.lattice = My_Moduli_Lattice()  # Divisibility between the moduli in orbits
+        for universe in universes:
+            self._add_term(universe)
+
+    def _add_term(self, universe):
+        """Adds universe unless a term already includes it, dropping the terms it includes.
+
+        Only terms on moduli that divide or are multiples of universe.n can include
+        it or be included, and the lattice lists exactly those moduli."""
+        a, n = universe.a, universe.n
+        if n not in self.lattice:
+            self.lattice.add_modulus(n)
+            self.orbits[n] = My_Dict()
+        orbit = self.orbits[n]
+        if a in orbit or any(a % d in self.orbits[d] for d in self.lattice.divisors(n)):
+            return
+
+        for m in self.lattice.multiples(n):
+            multiple_orbit = self.orbits[m]
+            included = My_List()
+            if m // n <= len(multiple_orbit):
+                included.extend(r for r in range(a, m, n) if r in multiple_orbit)
+            else:
+                included.extend(r for r in multiple_orbit if r % n == a)
+            for r in included:
+                self.terms.discard(multiple_orbit.pop(r))
+        orbit[a] = universe
+        self.terms.add(universe)
+
+    def contains(self, k):
+        return any(term.contains(k) for term in self.terms)
+
+    def __contains__(self, k):
+        return self.contains(k)
+
+    _SIEVE_LIMIT = 1 << 20  # Largest period (lcm of the moduli) counted with a sieve
+    _BLOCK_LIMIT = 1 << 16  # Largest lcm orbits are merged into before inclusion-exclusion
+    _EXPANSION_LIMIT = 1 << 19  # Work units (CRT pairs) inclusion-exclusion may spend before _avoiders takes over
+
+    def period(self):
+        """Returns the lcm of the term moduli: membership repeats with this period."""
+        return math.lcm(1, *(n for n, orbit in self.orbits.items() if len(orbit) > 0))
+
+    def count(self, lower, upper):
+        """Counts the members in [lower, upper] without enumerating them."""
+        if not (isinstance(lower, int) and isinstance(upper, int)):
+            raise TypeError("Bounds must be integers.")
+        if lower > upper:
+            raise ValueError("Lower bound must be <= upper bound.")
+        if upper < 0:
+            return 0
+        if any(len(orbit) == n for n, orbit in self.orbits.items()):
+            return upper - max(lower, 0) + 1
+        if self.period() <= self._SIEVE_LIMIT:
+            return self._sieve_count(lower, upper)
+        if upper - max(lower, 0) < self._SIEVE_LIMIT:
+            return self._window_count(max(lower, 0), upper)
+        try:
+            return self._inclusion_exclusion_count(lower, upper)
+        except ValueError:  # Too many overlapping classes: split the range instead
+            lower = max(lower, 0)
+            classes = sorted(((term.a, term.n) for term in self.terms), key=lambda c: -c[1])
+            return upper - lower + 1 - _avoiders(lower, upper, classes, self._BLOCK_LIMIT)
+
+    def _sieve_count(self, lower, upper):
+        """Counts members with a sieve over one period (vectorized with NumPy when available)."""
+        np = _numpy()
+        period = self.period()
+        if np is not None:
+            sieve = np.zeros(period, dtype=bool)
+            for term in self.terms:
+                sieve[term.a::term.n] = True
+            covered = lambda stop: int(np.count_nonzero(sieve[:stop]))
+        else:
+            sieve = bytearray(period)
+            for term in self.terms:
+                sieve[term.a::term.n] = b"\x01" * len(range(term.a, period, term.n))
+            covered = lambda stop: sieve.count(1, 0, stop)
+
+        per_period = covered(period)
+
+        def below(k):  # Members in [0, k)
+            return (k // period) * per_period + covered(k % period)
+
+        return below(upper + 1) - below(max(lower, 0)) if upper >= 0 else 0
+
+    def _window_count(self, lower, upper):
+        """Counts members by marking those of every term in the window [lower, upper] (lower >= 0)."""
+        window = bytearray(upper - lower + 1)
+        for term in self.terms:
+            members = term.members(lower, upper)
+            window[members.start - lower::term.n] = b"\x01" * len(members)
+        return window.count(1)
+
+    def _residue_blocks(self):
+        """Merges orbits sharing a factor into (L, mask, residues) blocks; None if a block is full."""
+        moduli = My_List()  # Block moduli, parallel to masks
+        masks = My_List()
+        for n in sorted(n for n, orbit in self.orbits.items() if len(orbit) > 0):
+            best = None
+            for i in range(len(moduli)):
+                lcm = math.lcm(moduli[i], n)
+                if lcm < moduli[i] * n and lcm <= self._BLOCK_LIMIT and (
+                        best is None or lcm < math.lcm(moduli[best], n)):
+                    best = i
+            if best is None:
+                lcm, mask = n, bytearray(n)
+                moduli.append(n)
+                masks.append(mask)
+            else:
+                lcm = math.lcm(moduli[best], n)
+                mask = masks[best] * (lcm // moduli[best])  # The same residues, lifted to the lcm
+                moduli[best] = lcm
+                masks[best] = mask
+            for a in self.orbits[n]:
+                mask[a::n] = b"\x01" * (lcm // n)
+
+        blocks = My_List()
+        for i in range(len(moduli)):
+            if masks[i].count(0) == 0:
+                return None
+            blocks.append((moduli[i], bytes(masks[i]), _residues(masks[i])))
+        return blocks
+
+    def _inclusion_exclusion_count(self, lower, upper):
+        """Counts members from the residue blocks, raising ValueError past _EXPANSION_LIMIT work."""
+        lower = max(lower, 0)
+        if upper < lower:
+            return 0
+        blocks = self._residue_blocks()
+        if blocks is None:
+            return upper - lower + 1
+        budget = [self._EXPANSION_LIMIT]
+
+        def spend(work):
+            budget[0] -= work
+            if budget[0] < 0:
+                raise ValueError("Too many overlapping residue classes to count this union exactly.")
+
+        def count_of(modulus, members):  # members: a mask when modulus is not None, else (r, m) classes
+            if modulus is None:
+                return sum((upper - r) // m - (lower - 1 - r) // m for r, m in members)
+            def below(k):
+                return (k // modulus) * members.count(1) + members.count(1, 0, k % modulus)
+            return below(upper + 1) - below(lower)
+
+        def intersect(modulus, members, block_modulus, block_mask, block_residues):
+            """Returns (modulus, members) for the members that are also in the block, or None if there are none."""
+            spend(64)  # Each intersection costs about as much as 64 CRT pairs
+            if modulus is not None:
+                lcm = math.lcm(modulus, block_modulus)
+                if lcm <= self._SIEVE_LIMIT:
+                    spend(lcm // 64)
+                    both = (int.from_bytes(members * (lcm // modulus), "little")
+                            & int.from_bytes(block_mask * (lcm // block_modulus), "little"))
+                    return None if both == 0 else (lcm, both.to_bytes(lcm, "little"))
+                members = [(r, modulus) for r in _residues(members)]
+            spend(len(members) * len(block_residues))
+            classes = []
+            for r, m in members:
+                for s in block_residues:
+                    overlap = _crt(r, m, s, block_modulus)
+                    if overlap is not None:
+                        classes.append(overlap)
+            return None if len(classes) == 0 else (None, tuple(classes))
+
+        def non_members():
+            outside = My_List()
+            for block_modulus, block_mask, block_residues in blocks:
+                outside_mask = block_mask.translate(_FLIP)
+                outside.append((block_modulus, outside_mask, _residues(outside_mask)))
+            modulus, members = outside[0][0], outside[0][1]
+            for i in range(1, len(outside)):
+                overlap = intersect(modulus, members, *outside[i])
+                if overlap is None:
+                    return 0
+                modulus, members = overlap
+            return count_of(modulus, members)
+
+        memo = My_Dict()  # (start, modulus, members) -> extensions(start, modulus, members)
+
+        def extensions(start, modulus, members):
+            """Signed count of the intersections of members with blocks[start:] and their supersets."""
+            key = (start, modulus, members)
+            if key not in memo:
+                total = 0
+                for i in range(start, len(blocks)):
+                    overlap = intersect(modulus, members, *blocks[i])
+                    if overlap is not None:
+                        total += count_of(*overlap) - extensions(i + 1, *overlap)
+                memo[key] = total
+            return memo[key]
+
+        try:
+            return upper - lower + 1 - non_members()
+        except ValueError:
+            budget[0] = self._EXPANSION_LIMIT
+        total = 0
+        for i in range(len(blocks)):
+            modulus, mask = blocks[i][0], blocks[i][1]
+            total += count_of(modulus, mask) - extensions(i + 1, modulus, mask)
+        return total
+
+    def stream(self, lower, upper):
+        """Yields the members in [lower, upper] in increasing order, merging the terms lazily."""
+        previous = None
+        for k in heapq.merge(*(term.members(lower, upper) for term in self.terms)):
+            if k != previous:
+                previous = k
+                yield k
+
+    def intersection(self, other):
+        """Returns a My_Zn_Union of the pairwise CRT intersections with a universe or union."""
+        others = other.terms if isinstance(other, My_Zn_Union) else (other,)
+        result = My_Zn_Union()
+        for term in self.terms:
+            for universe in others:
+                overlap = term.intersection(universe)
+                if overlap is not None:
+                    result._add_term(overlap)
+        return result
+
+    def __and__(self, other):
+        if isinstance(other, (My_Zn_verse, My_Zn_Union)):
+            return self.intersection(other)
+        return NotImplemented
+
+    __rand__ = __and__
+
+    def __or__(self, other):
+        if not isinstance(other, (My_Zn_verse, My_Zn_Union)):
+            return NotImplemented
+        result = My_Zn_Union(*self.terms)
+        for universe in (other.terms if isinstance(other, My_Zn_Union) else (other,)):
+            result._add_term(universe)
+        return result
+
+    __ror__ = __or__
+
+    def __sub__(self, other):
+        if isinstance(other, (My_Zn_verse, My_Zn_Union)):
+            return My_Zn_Difference(self, other)
+        return NotImplemented
+
+    def __repr__(self):
+        return " ∪ ".join(repr(term) for term in self.terms) if len(self.terms) > 0 else "∅"
+
+class My_Zn_Difference:
+    """Lazy set difference: the members of the union include that are not in the union exclude.
+
+    Intersecting a difference, or subtracting universes and unions from it, gives
+    another difference. A union with a difference, or a difference subtracted from
+    something, is not of that form and raises TypeError."""
+
+    def __init__(self, include, exclude):
+        if not (isinstance(include, (My_Zn_verse, My_Zn_Union)) and isinstance(exclude, (My_Zn_verse, My_Zn_Union))):
+            raise TypeError("A difference is taken between universes or unions of them.")
+        self.include = include if isinstance(include, My_Zn_Union) else My_Zn_Union(include)
+        self.exclude = exclude if isinstance(exclude, My_Zn_Union) else My_Zn_Union(exclude)
+
+    def contains(self, k):
+        return self.include.contains(k) and not self.exclude.contains(k)
+
+    def __contains__(self, k):
+        return self.contains(k)
+
+    def count(self, lower, upper):
+        """Counts the members in [lower, upper] as |include| - |include ∩ exclude|."""
+        return self.include.count(lower, upper) - self.include.intersection(self.exclude).count(lower, upper)
+
+    def stream(self, lower, upper):
+        """Yields the members in [lower, upper] in increasing order."""
+        for k in self.include.stream(lower, upper):
+            if not self.exclude.contains(k):
+                yield k
+
+    def __and__(self, other):
+        if isinstance(other, My_Zn_Difference):
+            return My_Zn_Difference(self.include.intersection(other.include), self.exclude | other.exclude)
+        if isinstance(other, (My_Zn_verse, My_Zn_Union)):
+            return My_Zn_Difference(self.include.intersection(other), self.exclude)
+        return NotImplemented
+
+    __rand__ = __and__
+
+    def __sub__(self, other):
+        if isinstance(other, (My_Zn_verse, My_Zn_Union)):
+            return My_Zn_Difference(self.include, self.exclude | other)
+        if isinstance(other, My_Zn_Difference):
+            self._unsupported()
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, (My_Zn_verse, My_Zn_Union)):
+            self._unsupported()
+        return NotImplemented
+
+    def __or__(self, other):
+        if isinstance(other, (My_Zn_verse, My_Zn_Union, My_Zn_Difference)):
+            self._unsupported()
+        return NotImplemented
+
+    __ror__ = __or__
+
+    @staticmethod
+    def _unsupported():
+        raise TypeError("A My_Zn_Difference supports & with any set and - of universes or unions only; "
+                        "its union or complement is not a difference of unions.")
+
+    def __repr__(self):
+        return f"({self.include}) \\ ({self.exclude})"
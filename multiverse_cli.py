@@ -0,0 +1,145 @@
+"""Headless batch queries against a multiverse.
+
+Builds a multiverse from moduli (or loads a file saved with My_Multiverse.save)
+and answers one query per line, read from a file or stdin, on stdout:
+
+    connections a n           the universes [a]ℤn has a connection to
+    locate k                  the universes containing the integer k
+    path a1 n1 a2 n2          a shortest chain of transitions, or None
+    reachable a1 n1 a2 n2     True or False
+
+Queries are split into chunks and answered by a process pool; every worker maps
+the same read-only snapshot file (My_Multiverse_File), so the graph is shared
+instead of copied. Answers keep the order of the queries, and the throughput is
+reported on stderr at the end.
+
+    python multiverse_cli.py --moduli 2,3,4,6,8,9,12 --workers 4 < queries.txt
+"""
+
+import argparse
+import itertools
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from multiverse import My_List, My_Multiverse, My_Multiverse_File
+
+_snapshot = None  # My_Multiverse_File opened by each worker
+
+
+def _open_snapshot(path):
+    """Pool initializer: maps the shared snapshot once per worker process."""
+    global _snapshot
+    _snapshot = My_Multiverse_File(path)
+
+
+def _format(snapshot, vertex_id):
+    a, n = snapshot.universe(vertex_id)
+    return f"[{a}]ℤ{n}"
+
+
+def answer(snapshot, query):
+    """Returns the answer line for one query line."""
+    fields = query.split()
+    if len(fields) == 0:
+        return ""
+    operation, args = fields[0], fields[1:]
+    try:
+        args = [int(arg) for arg in args]
+        if operation == "connections" and len(args) == 2:
+            vertex_id = snapshot.id_of(*args)
+            neighbors = ", ".join(_format(snapshot, neighbor) for neighbor in snapshot.neighbors(vertex_id))
+            return f"{_format(snapshot, vertex_id)} --> ([{neighbors}])"
+        if operation == "locate" and len(args) == 1:
+            return f"([{', '.join(_format(snapshot, vertex_id) for vertex_id in snapshot.locate(args[0]))}])"
+        if operation == "path" and len(args) == 4:
+            path = snapshot.shortest_path(*args)
+            return "None" if path is None else f"([{', '.join(f'[{a}]ℤ{n}' for a, n in path)}])"
+        if operation == "reachable" and len(args) == 4:
+            return str(snapshot.reachable(*args))
+    except (ValueError, KeyError) as error:
+        return f"error: {error.args[0] if error.args else error}"
+    return f"error: malformed query {query.strip()!r}"
+
+
+def _answer_chunk(queries):
+    """Pool task: answers a chunk of query lines with the worker's snapshot."""
+    return [answer(_snapshot, query) for query in queries]
+
+
+def _chunks(lines, size):
+    """Splits an iterator of lines into lists of at most size lines, lazily."""
+    while True:
+        chunk = list(itertools.islice(lines, size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="Answer batches of multiverse queries without the GUI.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--moduli", default="2,3,4,6,8,9,12",
+                        help="comma-separated moduli whose every residue is added (default: %(default)s)")
+    source.add_argument("--load", metavar="PATH", help="multiverse file saved with My_Multiverse.save")
+    parser.add_argument("queries", nargs="?", help="file with one query per line (default: stdin)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes; 1 answers in this process (default: %(default)s)")
+    parser.add_argument("--chunk-size", type=int, default=1024, help="queries per task (default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    started = time.perf_counter()
+
+    temporary = None
+    if args.load is not None:
+        path = args.load
+    else:
+        moduli = My_List()
+        moduli.extend(int(n) for n in args.moduli.split(",") if n.strip())
+        descriptor, temporary = tempfile.mkstemp(suffix=".znverse")
+        os.close(descriptor)
+        My_Multiverse.from_moduli(moduli, workers=args.workers).save(temporary)
+        path = temporary
+    ready = time.perf_counter()
+
+    queries = open(args.queries, encoding="utf-8") if args.queries is not None else sys.stdin
+    count = 0
+    try:
+        chunks = _chunks(iter(queries), args.chunk_size)
+        if args.workers <= 1:
+            _open_snapshot(path)
+            results = map(_answer_chunk, chunks)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(args.workers, initializer=_open_snapshot, initargs=(path,))
+            results = pool.imap(_answer_chunk, chunks)
+        try:
+            for answers in results:
+                sys.stdout.write("\n".join(answers) + "\n")
+                count += len(answers)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+    finally:
+        if queries is not sys.stdin:
+            queries.close()
+        if _snapshot is not None:
+            _snapshot.close()
+        if temporary is not None:
+            os.remove(temporary)
+
+    elapsed = time.perf_counter() - ready
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    print(f"{count} queries in {elapsed:.3f} s ({rate:.0f} queries/s, {args.workers} workers; "
+          f"setup {ready - started:.3f} s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
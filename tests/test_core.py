@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from multiverse import My_Multiverse, My_Zn_verse
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_incremental_changes_match_a_brute_force_rebuild(compact):
+    rng = random.Random(6)
+    multiverse = My_Multiverse(moduli=(2, 3, 4, 6, 12), max_connections=3, compact=compact)
+    for _ in range(150):
+        n = rng.choice((2, 3, 4, 5, 6, 8, 9, 10, 12, 18, 24, 36))
+        if rng.random() < 0.6:
+            multiverse.add_universe(rng.randrange(n), n)
+        else:
+            multiverse.remove_universe(rng.randrange(n), n)
+        multiverse.verify_connections()
+
+
+def test_verify_connections_detects_a_corrupted_index():
+    multiverse = My_Multiverse()
+    target = My_Zn_verse(0, 12)
+    del multiverse.orbits[12][0]  # The orbit index no longer knows [0]ℤ12
+    multiverse._create_connections()
+    with pytest.raises(RuntimeError, match="full rebuild"):
+        multiverse.verify_connections()
+    assert target in multiverse.graph
+
+
+def test_verify_connections_detects_stale_in_edges():
+    multiverse = My_Multiverse()
+    source = My_Zn_verse(0, 2)
+    target = next(iter(multiverse.graph.get_neighbors(source)))
+    multiverse.graph.in_edges[target].discard(source)
+    with pytest.raises(RuntimeError, match="In-edges"):
+        multiverse.verify_connections()
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_get_neighbors_returns_an_indexable_copy(compact):
+    multiverse = My_Multiverse(compact=compact)
+    source = My_Zn_verse(0, 2)
+    neighbors = multiverse.graph.get_neighbors(source)
+    first = neighbors[0]
+    view = multiverse.graph.neighbors_view(source)
+    multiverse.remove_universe(first.a, first.n)
+    assert neighbors[0] == first
+    assert first not in view
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_locate_many_matches_locate(monkeypatch, with_numpy):
+    import multiverse.universe
+
+    if with_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(multiverse.universe, "_np", None)
+        monkeypatch.setattr(multiverse.universe, "_np_loaded", True)
+    rng = random.Random(14)
+    multiverse = My_Multiverse(moduli=(2, 3, 4, 6, 8, 9, 12, 35))
+    multiverse.add_universes([(5, (1 << 21) + 3), (1 << 20, (1 << 21) + 3)])
+    multiverse.remove_universes([(1, 4), (7, 35)])
+    values = [rng.randrange(-10 ** 7, 10 ** 7) for _ in range(500)] + [5, (1 << 20) - 3]
+    for batch in (values, values[:20] + [2.0, "x", None]):
+        expected = [list(multiverse.locate(k)) for k in batch]
+        assert [list(found) for found in multiverse.locate_many(batch)] == expected
+        assert [list(found) for found in multiverse.locate_many(iter(batch))] == expected
@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from multiverse import My_Compact_Directed_Graph, My_Directed_Graph
+
+
+def _state(graph):
+    return [(vertex, list(graph.get_neighbors(vertex)), sorted(graph.predecessors(vertex)))
+            for vertex in graph.get_vertices()]
+
+
+@pytest.mark.parametrize("graph_class", [My_Directed_Graph, My_Compact_Directed_Graph])
+def test_set_neighbors_accepts_the_rows_own_view(graph_class):
+    graph = graph_class()
+    graph.set_neighbors(1, [2, 3])
+    graph.set_neighbors(1, graph.neighbors_view(1))
+    assert list(graph.get_neighbors(1)) == [2, 3]
+    graph.set_neighbors(1, graph.get_neighbors(1))
+    assert list(graph.get_neighbors(1)) == [2, 3]
+    assert list(graph.predecessors(2)) == [1]
+
+
+def test_storage_modes_agree_under_random_edits():
+    rng = random.Random(20)
+    plain, compact = My_Directed_Graph(), My_Compact_Directed_Graph()
+    for _ in range(3000):
+        operation = rng.randrange(4)
+        vertex = rng.randrange(40)
+        for graph in (plain, compact):
+            if operation == 0:
+                graph.add_edge(vertex, (vertex * 7) % 40)
+            elif operation == 1:
+                graph.set_neighbors(vertex, [(vertex + k) % 40 for k in range(1, 4)])
+            elif operation == 2:
+                graph.remove_edge(vertex, (vertex + 1) % 40)
+            else:
+                graph.remove_vertex(vertex)
+    assert _state(plain) == _state(compact)
@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_HEADLESS = """
+import sys
+from importlib.abc import MetaPathFinder
+
+class Missing(MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if name.split(".")[0] in ("tkinter", "ttkbootstrap"):
+            raise ModuleNotFoundError(name)
+
+sys.meta_path.insert(0, Missing())
+from ex_0 import My_List, My_Multiverse
+from multiverse import *
+My_Multiverse()
+"""
+
+
+def test_core_imports_without_the_gui_toolkit():
+    subprocess.run([sys.executable, "-c", _HEADLESS], cwd=_ROOT, check=True)
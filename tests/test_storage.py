@@ -0,0 +1,90 @@
+import random
+import struct
+
+import pytest
+
+from multiverse import My_Multiverse, My_Multiverse_File, My_Mutation_Log, My_Zn_verse
+
+
+@pytest.fixture
+def saved(tmp_path):
+    multiverse = My_Multiverse()
+    path = tmp_path / "multiverse.znverse"
+    multiverse.save(str(path), generation=3)
+    return multiverse, str(path)
+
+
+def test_rows_outlive_the_file(saved):
+    multiverse, path = saved
+    with My_Multiverse_File(path) as stored:
+        source = stored.id_of(0, 2)
+        neighbors = stored.neighbors(source)
+        predecessors = stored.predecessors(neighbors[0])
+        connections = [stored.universe(vertex_id) for vertex_id in neighbors]
+        assert stored.generation == 3
+    assert source in predecessors
+    assert connections == [(universe.a, universe.n) for universe in multiverse.graph.get_neighbors(My_Zn_verse(0, 2))]
+
+
+def test_load_matches_the_saved_multiverse(saved):
+    multiverse, path = saved
+    for compact in (False, True):
+        loaded = My_Multiverse.load(path, compact=compact)
+        assert [(universe, list(loaded.graph.get_neighbors(universe))) for universe in loaded.graph.get_vertices()] \
+            == [(universe, list(multiverse.graph.get_neighbors(universe))) for universe in multiverse.graph.get_vertices()]
+        loaded.verify_connections()
+
+
+def test_other_versions_are_rejected(saved):
+    _, path = saved
+    with open(path, "r+b") as file:
+        file.seek(12)
+        file.write(struct.pack("=I", My_Multiverse_File.VERSION + 1))
+    with pytest.raises(ValueError, match="version"):
+        My_Multiverse_File(path)
+
+
+def _state(multiverse):
+    return [(universe, list(multiverse.graph.get_neighbors(universe))) for universe in multiverse.graph.get_vertices()]
+
+
+def test_recovery_survives_a_torn_last_event(tmp_path):
+    log_path = str(tmp_path / "multiverse.log")
+    with My_Mutation_Log(log_path) as log:
+        multiverse = My_Multiverse(moduli=(2, 3))
+        multiverse.attach_log(log)
+        multiverse.add_universe(1, 4)
+    with open(log_path, "a", encoding="utf-8") as file:
+        file.write("add 3 1")  # A crash cut this write short
+
+    with My_Mutation_Log(log_path) as log:
+        recovered = My_Multiverse.recover(log)
+        recovered.add_universe(0, 6)
+    with My_Mutation_Log(log_path) as log:
+        assert _state(My_Multiverse.recover(log)) == _state(recovered)
+    assert "add 3 1add" not in open(log_path, encoding="utf-8").read()
+
+
+@pytest.mark.parametrize("compact_every", [None, 7])
+def test_recovery_matches_the_live_multiverse(tmp_path, compact_every):
+    rng = random.Random(22)
+    log_path, snapshot_path = str(tmp_path / "multiverse.log"), str(tmp_path / "multiverse.znverse")
+    moduli = (2, 3, 4, 6, 8, 9, 12, 18)
+    for round_ in range(5):
+        with My_Mutation_Log(log_path, snapshot_path, compact_every) as log:
+            multiverse = My_Multiverse.recover(log) if round_ > 0 else My_Multiverse(moduli=(2, 3))
+            if round_ == 0:
+                multiverse.attach_log(log)
+            for _ in range(40):
+                n = rng.choice(moduli)
+                operation = rng.random()
+                if operation < 0.6:
+                    multiverse.add_universe(rng.randrange(n), n)
+                elif operation < 0.95:
+                    multiverse.remove_universe(rng.randrange(n), n)
+                else:
+                    multiverse.remove_orbit(n)
+            expected = _state(multiverse)
+        with My_Mutation_Log(log_path, snapshot_path, compact_every) as log:
+            recovered = My_Multiverse.recover(log, check_consistency=True)
+            assert _state(recovered) == expected
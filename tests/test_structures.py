@@ -0,0 +1,68 @@
+import copy
+import gc
+import random
+import weakref
+
+from multiverse import My_Dict, My_List, My_Set
+
+
+class _Node:
+    pass
+
+
+def test_cycle_through_my_list_is_collected():
+    node = _Node()
+    node.items = My_List()
+    node.items.append(node)
+    alive = weakref.ref(node)
+    del node
+    gc.collect()
+    assert alive() is None
+
+
+def test_my_list_matches_list_under_random_edits():
+    rng = random.Random(2)
+    mine, expected = My_List(), []
+    for _ in range(5000):
+        operation = rng.randrange(5)
+        if operation == 0 or len(expected) == 0:
+            item = object()
+            mine.append(item)
+            expected.append(item)
+        elif operation == 1:
+            index = rng.randrange(len(expected) + 1)
+            mine.insert(index, index)
+            expected.insert(index, index)
+        elif operation == 2:
+            index = rng.randrange(len(expected))
+            assert mine.pop(index) == expected.pop(index)
+        elif operation == 3:
+            index = rng.randrange(len(expected))
+            mine[index] = str(index)
+            expected[index] = str(index)
+        else:
+            mine.extend(range(3))
+            expected.extend(range(3))
+        assert len(mine) == len(expected)
+    assert list(mine) == expected
+    assert list(copy.copy(mine)) == expected
+    assert list(mine[::3]) == expected[::3]
+
+
+def test_my_dict_and_my_set_match_builtins():
+    rng = random.Random(3)
+    mine, expected = My_Dict(), {}
+    members, expected_members = My_Set(), set()
+    for _ in range(5000):
+        key = rng.randrange(300)
+        if rng.random() < 0.6:
+            mine[key] = key * 2
+            expected[key] = key * 2
+            assert members.add(key) == (key not in expected_members)
+            expected_members.add(key)
+        else:
+            assert mine.pop(key, -1) == expected.pop(key, -1)
+            assert members.discard(key) == (key in expected_members)
+            expected_members.discard(key)
+    assert list(mine.items()) == list(expected.items())
+    assert sorted(members) == sorted(expected_members)
@@ -0,0 +1,95 @@
+import gc
+import random
+
+import pytest
+
+from multiverse import My_Multiverse, My_Zn_Union, My_Zn_verse
+
+
+def test_universes_are_interned_while_referenced():
+    universe = My_Zn_verse(5, 97)
+    assert My_Zn_verse(5, 97) is universe
+    assert My_Zn_verse.lookup(5, 97) is universe
+    del universe
+    gc.collect()
+    assert My_Zn_verse.lookup(5, 97) is None
+
+
+def test_removing_from_one_multiverse_leaves_others_intact():
+    first, second = My_Multiverse(), My_Multiverse()
+    first.remove_universe(0, 2)
+    assert second.reachable_within(0, 2, 0, 2, 0)
+    assert second.reachable(0, 2, 0, 2)
+    assert second.shortest_path(0, 2, 0, 2) is not None
+    assert My_Zn_verse(0, 2) in second.graph
+
+
+def test_contains_many_matches_contains():
+    rng = random.Random(14)
+    for _ in range(50):
+        n = rng.randrange(2, 10 ** 6)
+        universe = My_Zn_verse(rng.randrange(n), n)
+        values = [rng.randrange(-10 ** 9, 10 ** 9) for _ in range(200)] + [universe.a, 1.0 * universe.a, "x"]
+        assert list(universe.contains_many(values)) == [universe.contains(k) for k in values]
+
+
+def _members(expression, limit):
+    return [k for k in range(limit) if k in expression]
+
+
+def test_set_algebra_is_closed_over_universes_unions_and_differences():
+    u, v, w = My_Zn_verse(1, 4), My_Zn_verse(1, 6), My_Zn_verse(5, 12)
+    union = My_Zn_Union(v, My_Zn_verse(0, 9))
+    difference = u - w
+    limit = 3 * 4 * 6 * 9 * 12
+    cases = {
+        "u & union": (u & union, lambda k: k in u and k in union),
+        "union & u": (union & u, lambda k: k in u and k in union),
+        "(u - w) & v": (difference & v, lambda k: k in u and k not in w and k in v),
+        "v & (u - w)": (v & difference, lambda k: k in u and k not in w and k in v),
+        "(u - w) & (v - u)": (difference & (v - u), lambda k: False),
+        "(u - w) - v": (difference - v, lambda k: k in u and k not in w and k not in v),
+        "union | u": (union | u, lambda k: k in u or k in union),
+    }
+    for name, (expression, member) in cases.items():
+        expected = [k for k in range(limit) if member(k)]
+        assert _members(expression, limit) == expected, name
+        assert expression.count(0, limit - 1) == len(expected), name
+
+
+def test_unsupported_operands_raise_type_error():
+    u, v, w = My_Zn_verse(1, 4), My_Zn_verse(1, 6), My_Zn_verse(5, 12)
+    union = My_Zn_Union(u, v)
+    for operation in (lambda: u - (v - w), lambda: union | (v - w), lambda: (v - w) | u,
+                      lambda: union - (v - w), lambda: (u - v) - (v - w),
+                      lambda: u | 3, lambda: u - 3, lambda: union | 3, lambda: union & 3, lambda: (u - v) & 3):
+        with pytest.raises(TypeError):
+            operation()
+
+
+@pytest.mark.parametrize("expansion_limit", [My_Zn_Union._EXPANSION_LIMIT, 0])
+def test_union_count_matches_brute_force(monkeypatch, expansion_limit):
+    # Small limits force the inclusion-exclusion path (and, with no budget, the range splitting)
+    monkeypatch.setattr(My_Zn_Union, "_SIEVE_LIMIT", 64)
+    monkeypatch.setattr(My_Zn_Union, "_BLOCK_LIMIT", 16)
+    monkeypatch.setattr(My_Zn_Union, "_EXPANSION_LIMIT", expansion_limit)
+    rng = random.Random(17)
+    for _ in range(100):
+        terms = []
+        for _ in range(rng.randrange(1, 7)):
+            n = rng.randrange(2, 60)
+            terms.append(My_Zn_verse(rng.randrange(n), n))
+        union = My_Zn_Union(*terms)
+        lower = rng.randrange(-100, 3000)
+        upper = lower + rng.randrange(0, 3000)
+        expected = sum(1 for k in range(max(lower, 0), upper + 1) if any(k in term for term in terms))
+        assert union.count(lower, upper) == expected, (terms, lower, upper)
+
+
+def test_union_count_of_many_coprime_terms_does_not_give_up():
+    primes = [p for p in range(1009, 1300) if all(p % d for d in range(2, 37))][:30]
+    terms = [My_Zn_verse(7 * i % p, p) for i, p in enumerate(primes)]
+    union = My_Zn_Union(*terms)
+    upper = 10 ** 15
+    tail = sum(1 for k in range(upper - 10 ** 5 + 1, upper + 1) if any(k in term for term in terms))
+    assert union.count(0, upper) - union.count(0, upper - 10 ** 5) == tail